@@ -1,31 +1,70 @@
 """FastAPI application entry point."""
 
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .responses import ORJSONResponse
 from .routes import migrations, schemas, mappings, preview, events, ai, mcp, leads, auth
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up shared clients for the lifetime of the app."""
+    redis_url = os.getenv("REDIS_URL")
+    redis_client = None
+    if redis_url:
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise ImportError("redis package required when REDIS_URL is set")
+        redis_client = aioredis.from_url(redis_url)
+        auth.session_store = auth.RedisSessionStore(redis_client)
+
+    # Redis expires keys itself; the in-memory store needs a sweeper
+    sweeper = None
+    if isinstance(auth.session_store, auth.InMemorySessionStore):
+        sweeper = asyncio.create_task(auth.sweep_sessions(auth.session_store))
+
+    yield
+
+    await migrations.cancel_running_migrations()
+    if sweeper is not None:
+        sweeper.cancel()
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
 app = FastAPI(
     title="Migrate Services API",
     description="API for the service migration framework",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for frontend
+CORS_ORIGINS = frozenset({
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://localhost:3000",
+    "https://smoothexit.to",
+    "https://www.smoothexit.to",
+    "https://smoothexit.vercel.app",
+    "https://api.smoothexit.to",
+})
+CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+CORS_HEADERS = ("Authorization", "Content-Type", "If-None-Match")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-        "http://localhost:3000",
-        "https://smoothexit.to",
-        "https://www.smoothexit.to",
-        "https://smoothexit.vercel.app",
-        "https://api.smoothexit.to",
-    ],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_METHODS,
+    allow_headers=CORS_HEADERS,
 )
 
 # Include routers
@@ -1,12 +1,23 @@
 """Pydantic models for API requests and responses."""
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
-from enum import Enum
+from typing import Annotated, Any, Dict, List, Optional
+from pydantic import BaseModel, Field, ValidatorFunctionWrapHandler, WrapValidator
+from enum import StrEnum
 from datetime import datetime
 
 
-class DataSourceTypeEnum(str, Enum):
+def _pass_through_dict(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Return plain dicts as-is instead of rebuilding them key by key."""
+    if type(value) is dict:
+        return value
+    return handler(value)
+
+
+# Free-form JSON objects that are passed straight through to the services
+RawDict = Annotated[Dict[str, Any], WrapValidator(_pass_through_dict)]
+
+
+class DataSourceTypeEnum(StrEnum):
     API = "api"
     CSV = "csv"
     JSON = "json"
@@ -14,7 +25,7 @@ class DataSourceTypeEnum(str, Enum):
     WEB_SCRAPE = "web_scrape"
 
 
-class MigrationStatusEnum(str, Enum):
+class MigrationStatusEnum(StrEnum):
     DRAFT = "draft"
     PENDING = "pending"
     EXTRACTING = "extracting"
@@ -41,14 +52,14 @@ class DataSourceCreate(BaseModel):
     screenshot_path: Optional[str] = None
     batch_size: int = 100
     rate_limit: Optional[float] = None
-    filters: Dict[str, Any] = Field(default_factory=dict)
+    filters: RawDict = Field(default_factory=dict)
 
 
 class FieldMappingCreate(BaseModel):
     source_field: str
     target_field: str
     transform: str = "direct"
-    config: Dict[str, Any] = Field(default_factory=dict)
+    config: RawDict = Field(default_factory=dict)
 
 
 class EntityMappingCreate(BaseModel):
@@ -86,7 +97,7 @@ class MigrationUpdate(BaseModel):
 
 
 class PreviewRequest(BaseModel):
-    source_record: Dict[str, Any]
+    source_record: RawDict
     source_service: str
     source_entity: str
     target_service: str
@@ -95,7 +106,7 @@ class PreviewRequest(BaseModel):
 
 
 class SchemaInferRequest(BaseModel):
-    data: List[Dict[str, Any]]
+    data: List[RawDict]
     service: str
     entity: str
 
@@ -113,10 +124,11 @@ class BatchUploadRequest(BaseModel):
     """Request for uploading a batch of records to target service."""
     target_service: str
     target_entity: str
-    records: List[Dict[str, Any]]
+    records: List[RawDict]
     api_key: str
     site: Optional[str] = None
     dry_run: bool = True
+    concurrency: int = Field(16, ge=1, le=256)  # max in-flight uploads in live mode
 
 
 class BatchUploadResultItem(BaseModel):
@@ -158,7 +170,7 @@ class MigrationStepResponse(BaseModel):
     records_processed: int = 0
     records_succeeded: int = 0
     records_failed: int = 0
-    errors: List[Dict[str, Any]] = Field(default_factory=list)
+    errors: List[RawDict] = Field(default_factory=list)
 
 
 class MigrationResponse(BaseModel):
@@ -188,15 +200,15 @@ class MigrationListResponse(BaseModel):
 
 
 class PreviewResponse(BaseModel):
-    source_data: Dict[str, Any]
-    transformed_data: Dict[str, Any]
+    source_data: RawDict
+    transformed_data: RawDict
     validation_errors: List[str] = Field(default_factory=list)
     is_valid: bool = True
 
 
 class SchemaInferResponse(BaseModel):
     schema: EntitySchema
-    sample_values: Dict[str, Any]
+    sample_values: RawDict
 
 
 class MappingResponse(BaseModel):
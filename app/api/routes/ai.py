@@ -6,7 +6,6 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
-import httpx
 
 router = APIRouter()
 
@@ -46,6 +45,9 @@ class SuggestMappingsRequest(BaseModel):
 @router.post("/parse-api-docs")
 async def parse_api_docs(request: ParseAPIDocsRequest):
     """Parse API documentation to extract schema information."""
+    # Imported here so httpx stays off the app's cold-start path
+    import httpx
+
     try:
         headers = {}
         if request.api_key:
@@ -1,7 +1,14 @@
 """Authentication endpoints."""
 
+import asyncio
+import base64
+import hashlib
+import heapq
+import hmac
 import os
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -15,10 +22,130 @@ security = HTTPBasic()
 # Hardcoded admin credentials (use env vars to override in production)
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "smoothexit2024")
+_CREDENTIALS = (ADMIN_USERNAME, ADMIN_PASSWORD)
+
+# Per-process key for hashing passwords; only the stored password's digest
+# is kept for comparison
+_HMAC_KEY = secrets.token_bytes(32)
+_STORED_USERNAME = ADMIN_USERNAME.encode()
+_STORED_PASSWORD_HMAC = hmac.digest(_HMAC_KEY, ADMIN_PASSWORD.encode(), "sha256")
 
-# Session tokens (in-memory for simplicity, use Redis in production)
-_sessions: dict[str, datetime] = {}
 SESSION_DURATION = timedelta(hours=24)
+SESSION_KEY_PREFIX = "sess:"
+SESSION_SWEEP_INTERVAL = 60  # seconds
+
+# Login attempts allowed per client IP within each window
+LOGIN_RATE_LIMIT = 5
+LOGIN_RATE_WINDOW = 60.0  # seconds
+_LOGIN_ATTEMPTS_MAX_KEYS = 10_000
+_login_attempts: dict[str, tuple[int, float]] = {}
+
+
+class _RandomPool:
+    """Buffer of os.urandom bytes handed out in slices.
+
+    Amortises the getrandom() syscall across many session tokens. The buffer
+    is discarded after a fork so worker processes never share bytes.
+    """
+
+    REFILL_SIZE = 4096
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def take(self, n: int) -> bytes:
+        with self._lock:
+            pid = os.getpid()
+            if pid != self._pid:
+                self._buf.clear()
+                self._pid = pid
+            if len(self._buf) < n:
+                self._buf.extend(os.urandom(max(n, self.REFILL_SIZE)))
+            out = bytes(self._buf[:n])
+            del self._buf[:n]
+            return out
+
+
+_random_pool = _RandomPool()
+
+
+def token_urlsafe(nbytes: int = 32) -> str:
+    """Equivalent of secrets.token_urlsafe drawing from the shared pool."""
+    return base64.urlsafe_b64encode(_random_pool.take(nbytes)).rstrip(b"=").decode("ascii")
+
+
+class InMemorySessionStore:
+    """Process-local session store, used when REDIS_URL is not set."""
+
+    def __init__(self):
+        self._sessions: dict[str, datetime] = {}
+        # Min-heap of (expires_at, token) so expired tokens can be purged
+        # without scanning every session
+        self._expiry_heap: list[tuple[datetime, str]] = []
+
+    async def create(self, token: str, ttl: timedelta) -> None:
+        expires_at = datetime.utcnow() + ttl
+        self._sessions[token] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, token))
+
+    async def exists(self, token: str) -> bool:
+        expires_at = self._sessions.get(token)
+        if expires_at is None:
+            return False
+        if datetime.utcnow() > expires_at:
+            del self._sessions[token]
+            return False
+        return True
+
+    async def delete(self, token: str) -> None:
+        self._sessions.pop(token, None)
+
+    def sweep(self) -> int:
+        """Drop expired sessions. Returns the number of heap entries popped."""
+        now = datetime.utcnow()
+        heap = self._expiry_heap
+        popped = 0
+        while heap and heap[0][0] <= now:
+            _, token = heapq.heappop(heap)
+            self._sessions.pop(token, None)
+            popped += 1
+        return popped
+
+
+async def sweep_sessions(store: InMemorySessionStore, interval: float = SESSION_SWEEP_INTERVAL):
+    """Periodically purge expired sessions from an in-memory store."""
+    while True:
+        await asyncio.sleep(interval)
+        store.sweep()
+
+
+class RedisSessionStore:
+    """Session store backed by Redis keys with a server-side TTL."""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def create(self, token: str, ttl: timedelta) -> None:
+        await self._client.set(
+            f"{SESSION_KEY_PREFIX}{token}", "1", ex=int(ttl.total_seconds())
+        )
+
+    async def exists(self, token: str) -> bool:
+        return bool(await self._client.exists(f"{SESSION_KEY_PREFIX}{token}"))
+
+    async def delete(self, token: str) -> None:
+        await self._client.delete(f"{SESSION_KEY_PREFIX}{token}")
+
+
+# Replaced with a RedisSessionStore at startup when REDIS_URL is configured
+session_store = InMemorySessionStore()
+
+
+def get_session_store():
+    """Dependency returning the active session store."""
+    return session_store
 
 
 class LoginRequest(BaseModel):
@@ -40,31 +167,49 @@ class AuthStatus(BaseModel):
 
 
 def get_credentials() -> tuple[str, str]:
-    """Get admin credentials from env vars or hardcoded defaults."""
-    return ADMIN_USERNAME, ADMIN_PASSWORD
+    """Get admin credentials from env vars or hardcoded defaults.
+
+    The env vars are read once at import, so the same tuple is returned on
+    every call.
+    """
+    return _CREDENTIALS
 
 
 def verify_credentials(username: str, password: str) -> bool:
     """Verify username and password."""
-    stored_user, stored_pass = get_credentials()
-    return secrets.compare_digest(username, stored_user) and secrets.compare_digest(password, stored_pass)
+    candidate = hmac.digest(_HMAC_KEY, password.encode(), "sha256")
+    password_ok = secrets.compare_digest(candidate, _STORED_PASSWORD_HMAC)
+    username_ok = secrets.compare_digest(username.encode(), _STORED_USERNAME)
+    return password_ok and username_ok
 
 
-def create_session_token() -> str:
+async def create_session_token(store) -> str:
     """Create a new session token."""
-    token = secrets.token_urlsafe(32)
-    _sessions[token] = datetime.utcnow() + SESSION_DURATION
+    token = token_urlsafe(32)
+    await store.create(token, SESSION_DURATION)
     return token
 
 
-def verify_session_token(token: str) -> bool:
+async def verify_session_token(store, token: str) -> bool:
     """Verify a session token is valid and not expired."""
-    if token not in _sessions:
-        return False
-    if datetime.utcnow() > _sessions[token]:
-        del _sessions[token]
-        return False
-    return True
+    return await store.exists(token)
+
+
+def check_login_rate(client_ip: str) -> bool:
+    """Record a login attempt and return False if the IP is over the limit."""
+    now = time.monotonic()
+    count, window_start = _login_attempts.get(client_ip, (0, now))
+    if now - window_start >= LOGIN_RATE_WINDOW:
+        count, window_start = 0, now
+    count += 1
+    _login_attempts[client_ip] = (count, window_start)
+
+    if len(_login_attempts) > _LOGIN_ATTEMPTS_MAX_KEYS:
+        for ip, (_, started) in list(_login_attempts.items()):
+            if now - started >= LOGIN_RATE_WINDOW:
+                del _login_attempts[ip]
+
+    return count <= LOGIN_RATE_LIMIT
 
 
 def get_session_token(request: Request) -> Optional[str]:
@@ -80,21 +225,30 @@ def get_session_token(request: Request) -> Optional[str]:
     return None
 
 
-async def require_auth(request: Request):
+async def require_auth(request: Request, store=Depends(get_session_store)):
     """Dependency to require authentication."""
     token = get_session_token(request)
-    if not token or not verify_session_token(token):
+    if not token or not await verify_session_token(store, token):
         raise HTTPException(status_code=401, detail="Not authenticated")
     return token
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest, response: Response):
+async def login(
+    request: LoginRequest,
+    response: Response,
+    http_request: Request,
+    store=Depends(get_session_store),
+):
     """Login with username and password."""
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    if not check_login_rate(client_ip):
+        raise HTTPException(status_code=429, detail="Too many login attempts, try again later")
+
     if not verify_credentials(request.username, request.password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_session_token()
+    token = await create_session_token(store)
     response.set_cookie(
         key="session_token",
         value=token,
@@ -107,21 +261,31 @@ async def login(request: LoginRequest, response: Response):
 
 
 @router.post("/logout", response_model=LoginResponse)
-async def logout(request: Request, response: Response):
+async def logout(request: Request, response: Response, store=Depends(get_session_store)):
     """Logout and invalidate session."""
     token = get_session_token(request)
-    if token and token in _sessions:
-        del _sessions[token]
+    if token:
+        await store.delete(token)
 
     response.delete_cookie("session_token")
     return LoginResponse(success=True, message="Logged out")
 
 
 @router.get("/status", response_model=AuthStatus)
-async def auth_status(request: Request):
-    """Check authentication status."""
+async def auth_status(request: Request, response: Response, store=Depends(get_session_store)):
+    """Check authentication status.
+
+    Authenticated responses carry an ETag derived from the session token, so
+    clients polling with If-None-Match get a bodiless 304 while the session
+    stays valid.
+    """
     token = get_session_token(request)
-    if token and verify_session_token(token):
+    if token and await verify_session_token(store, token):
+        etag = f'"{hashlib.blake2s(token.encode(), digest_size=8).hexdigest()}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
         stored_user, _ = get_credentials()
         return AuthStatus(authenticated=True, username=stored_user)
     return AuthStatus(authenticated=False)
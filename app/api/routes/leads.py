@@ -11,6 +11,7 @@ router = APIRouter()
 
 # Store leads in a JSON file (in production, use a database)
 LEADS_FILE = Path(__file__).parent.parent.parent.parent / "data" / "leads.json"
+LEADS_PATH = str(LEADS_FILE)
 
 
 class MigrationRequest(BaseModel):
@@ -31,12 +32,13 @@ class MigrationRequestResponse(BaseModel):
 
 def load_leads() -> list:
     """Load leads from JSON file."""
-    if not LEADS_FILE.exists():
-        LEADS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        LEADS_FILE.write_text("[]")
-        return []
+    # Open directly rather than stat-ing first; a missing file just means
+    # no leads yet (save_leads creates it)
     try:
-        return json.loads(LEADS_FILE.read_text())
+        with open(LEADS_PATH, "rb") as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        return []
     except json.JSONDecodeError:
         return []
 
@@ -1,12 +1,22 @@
 """MCP (Model Context Protocol) server integration endpoints."""
 
 import asyncio
+import functools
+import itertools
 import json
-import subprocess
+import logging
 import os
+import re
+import shutil
+import threading
+import time
 from typing import Any, Dict, List, Optional
+
+import orjson
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -18,6 +28,7 @@ class MCPServerConfig(BaseModel):
     args: List[str]  # e.g., ["-y", "@anthropic/mcp-server-stripe"]
     env: Optional[Dict[str, str]] = None
     description: Optional[str] = None
+    max_concurrency: int = Field(default=16, ge=1, le=512)  # in-flight requests per server
 
 
 class MCPServerStatus(BaseModel):
@@ -42,6 +53,64 @@ class MCPResourceRequest(BaseModel):
     resource_uri: str
 
 
+# How long schema discovery reuses sample tool/resource responses
+SCHEMA_CACHE_TTL = 300.0  # seconds
+
+# Environment inherited by MCP server processes, snapshotted at import
+_BASE_ENV: Dict[str, str] = dict(os.environ)
+
+# Static JSON-RPC payloads, built once
+_INITIALIZE_PARAMS = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {
+        "name": "migrate-services",
+        "version": "1.0.0"
+    }
+}
+_INITIALIZED_NOTIFICATION = orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized"
+}) + b"\n"
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_command(command: str) -> str:
+    """Resolve a server command against PATH once, keeping the name if not found."""
+    return shutil.which(command) or command
+
+
+def _make_request(request_id: int, method: str, params: Optional[Dict] = None) -> Dict:
+    """Build a JSON-RPC request envelope."""
+    if params is None:
+        return {"jsonrpc": "2.0", "id": request_id, "method": method}
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+# Verb fragments stripped from list/search tool names to get the entity name
+_TOOL_VERB_RE = re.compile(r"list_|search_")
+
+# Schema field type for each type json.loads can produce (exact type match,
+# so bool is not treated as int)
+_FIELD_TYPE_MAP = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    dict: "object",
+    list: "array",
+    type(None): "string",
+}
+
+# Most of a tool result that schema discovery will parse for a sample
+MAX_SAMPLE_PARSE_BYTES = 1_000_000
+
+# Tool results at least this large are parsed in a worker thread
+OFFLOAD_PARSE_BYTES = 32_000
+
+# Largest single JSON-RPC message line accepted from a server
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
 # In-memory storage for configured MCP servers
 MCP_SERVERS: Dict[str, MCPServerConfig] = {}
 
@@ -81,142 +150,272 @@ PREDEFINED_MCP_SERVERS = {
 }
 
 
+_PREDEFINED_NAMES = frozenset(PREDEFINED_MCP_SERVERS)
+
+# Static part of each predefined server's listing entry
+_PREDEFINED_SERVER_ENTRIES = tuple(
+    {
+        "name": config.name,
+        "command": config.command,
+        "args": config.args,
+        "description": config.description,
+        "predefined": True,
+    }
+    for config in PREDEFINED_MCP_SERVERS.values()
+)
+
+
 class MCPClient:
-    """Simple MCP client for communicating with MCP servers."""
+    """Simple MCP client for communicating with MCP servers.
+
+    All coroutines must be awaited on the running MCP loop (route handlers go
+    through ``_on_mcp_loop``); nothing here looks up a loop implicitly.
+    """
+
+    __slots__ = (
+        "config",
+        "process",
+        "_tools",
+        "_resources",
+        "_request_ids",
+        "_pending",
+        "_reader_task",
+        "_semaphore",
+        "_stderr_task",
+        "_cache",
+        "_cache_locks",
+        "_reconnect_lock",
+    )
 
     def __init__(self, config: MCPServerConfig):
         self.config = config
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self._tools: List[Dict] = []
         self._resources: List[Dict] = []
+        # JSON-RPC ids must be unique per outstanding request
+        self._request_ids = itertools.count(1)
+        # Responses are routed to waiting callers by id, so several requests
+        # can be in flight on one process
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        # Callers beyond the limit wait here instead of piling into the pipe
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        self._stderr_task: Optional[asyncio.Task] = None
+        # Cached responses for idempotent calls: key -> (expires_at, response)
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_locks: Dict[tuple, asyncio.Lock] = {}
+        self._reconnect_lock = asyncio.Lock()
 
     async def connect(self) -> bool:
         """Start the MCP server process and initialize connection."""
         try:
-            # Prepare environment
-            env = os.environ.copy()
-            if self.config.env:
-                env.update(self.config.env)
+            # Prepare environment (the base snapshot is never mutated)
+            env = {**_BASE_ENV, **self.config.env} if self.config.env else _BASE_ENV
 
             # Start the MCP server process
-            self.process = subprocess.Popen(
-                [self.config.command] + self.config.args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            self.process = await asyncio.create_subprocess_exec(
+                _resolve_command(self.config.command),
+                *self.config.args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=env,
+                limit=MAX_MESSAGE_BYTES,
             )
+            self._reader_task = asyncio.create_task(self._read_loop())
+            # Keep stderr flowing so a chatty server can't fill the pipe and stall
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
 
             # Send initialize request
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {
-                        "name": "migrate-services",
-                        "version": "1.0.0"
-                    }
-                }
-            }
-
-            response = await self._send_request(init_request)
+            response = await self._send_request("initialize", _INITIALIZE_PARAMS)
             if response and "result" in response:
                 # Send initialized notification
-                await self._send_notification({
-                    "jsonrpc": "2.0",
-                    "method": "notifications/initialized"
-                })
-
-                # List available tools
-                tools_response = await self._send_request({
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/list"
-                })
-                if tools_response and "result" in tools_response:
-                    self._tools = tools_response["result"].get("tools", [])
-
-                # List available resources
-                resources_response = await self._send_request({
-                    "jsonrpc": "2.0",
-                    "id": 3,
-                    "method": "resources/list"
-                })
-                if resources_response and "result" in resources_response:
-                    self._resources = resources_response["result"].get("resources", [])
+                await self._send_notification(_INITIALIZED_NOTIFICATION)
 
+                await self._list_capabilities()
                 return True
             return False
         except Exception as e:
-            print(f"Failed to connect to MCP server: {e}")
+            logger.warning("Failed to connect to MCP server %s: %s", self.config.name, e)
             return False
 
-    async def _send_request(self, request: Dict) -> Optional[Dict]:
-        """Send a JSON-RPC request and wait for response."""
-        if not self.process or not self.process.stdin or not self.process.stdout:
-            return None
+    async def _list_capabilities(self):
+        """Fetch the server's tools and resources."""
+        # tools/list and resources/list are independent
+        tools_response, resources_response = await asyncio.gather(
+            self._send_request("tools/list"),
+            self._send_request("resources/list"),
+        )
+        if tools_response and "result" in tools_response:
+            self._tools = tools_response["result"].get("tools", [])
+        if resources_response and "result" in resources_response:
+            self._resources = resources_response["result"].get("resources", [])
+
+    def is_alive(self) -> bool:
+        """Whether the server process and its response reader are running (no round-trip)."""
+        return (
+            self.process is not None
+            and self.process.returncode is None
+            and self._reader_task is not None
+        )
 
-        try:
-            # Write request
-            request_str = json.dumps(request) + "\n"
-            self.process.stdin.write(request_str.encode())
-            self.process.stdin.flush()
-
-            # Read response (with timeout)
-            loop = asyncio.get_event_loop()
-            response_line = await asyncio.wait_for(
-                loop.run_in_executor(None, self.process.stdout.readline),
-                timeout=30.0
-            )
+    async def _ensure_connected(self):
+        """Restart the server if its process or response reader has stopped.
 
-            if response_line:
-                return json.loads(response_line.decode())
-            return None
-        except asyncio.TimeoutError:
-            return None
+        Raises ConnectionError if it cannot be restarted, so callers fail fast
+        instead of waiting out the request timeout.
+        """
+        if self.is_alive():
+            return
+        async with self._reconnect_lock:
+            if self.is_alive():
+                return
+            logger.warning("MCP server %s exited or stopped responding; reconnecting", self.config.name)
+            await self.disconnect()
+            self._cache.clear()
+            if not await self.connect():
+                raise ConnectionError(f"MCP server '{self.config.name}' died and could not be restarted")
+
+    async def refresh(self):
+        """Drop cached responses and re-list tools and resources."""
+        await self._ensure_connected()
+        self._cache.clear()
+        await self._list_capabilities()
+
+    async def _cached_request(self, method: str, params: Dict, ttl: float) -> Optional[Dict]:
+        """Send a request, reusing a successful response for ``ttl`` seconds."""
+        key = (method, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        # One request per key on a miss; concurrent callers wait for it
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            try:
+                response = await self._send_request(method, params)
+                if response and "result" in response:
+                    self._cache[key] = (time.monotonic() + ttl, response)
+            finally:
+                # Callers already queued keep the lock object; later ones hit the cache
+                if self._cache_locks.get(key) is lock:
+                    del self._cache_locks[key]
+            return response
+
+    async def _read_loop(self):
+        """Read responses from stdout and resolve the matching pending request."""
+        stdout = self.process.stdout
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
         except Exception as e:
-            print(f"Error sending MCP request: {e}")
+            # e.g. a line over MAX_MESSAGE_BYTES; the stream can't be resynced
+            logger.warning("MCP reader for %s stopped: %s", self.config.name, e)
+        finally:
+            # A reader replaced by a reconnect must not touch the new connection.
+            # Otherwise mark the client dead so _ensure_connected restarts it.
+            if self._reader_task is asyncio.current_task():
+                self._reader_task = None
+                self._fail_pending(ConnectionError("MCP server closed its output"))
+
+    async def _drain_stderr(self):
+        """Consume the server's stderr, logging it at debug level."""
+        stderr = self.process.stderr
+        while True:
+            line = await stderr.readline()
+            if not line:
+                break
+            logger.debug("mcp[%s] stderr: %s", self.config.name, line.decode(errors="replace").rstrip())
+
+    def _fail_pending(self, exc: Exception):
+        """Fail every request still waiting for a response."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _send_request(self, method: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Send a JSON-RPC request and wait for its response."""
+        process = self.process
+        if not process or not process.stdin or not self._reader_task:
             return None
+        stdin = process.stdin
 
-    async def _send_notification(self, notification: Dict):
-        """Send a JSON-RPC notification (no response expected)."""
+        async with self._semaphore:
+            request_id = next(self._request_ids)
+            future = asyncio.get_running_loop().create_future()
+            pending = self._pending
+            pending[request_id] = future
+
+            try:
+                # Write request
+                stdin.write(orjson.dumps(_make_request(request_id, method, params)) + b"\n")
+                await stdin.drain()
+
+                # Wait for the reader to route the response here (with timeout)
+                return await asyncio.wait_for(future, timeout=30.0)
+            except asyncio.TimeoutError:
+                return None
+            except Exception as e:
+                logger.warning("Error sending MCP request to %s: %s", self.config.name, e)
+                return None
+            finally:
+                pending.pop(request_id, None)
+
+    async def _send_notification(self, notification: bytes):
+        """Send an encoded JSON-RPC notification (no response expected)."""
         if not self.process or not self.process.stdin:
             return
 
         try:
-            notification_str = json.dumps(notification) + "\n"
-            self.process.stdin.write(notification_str.encode())
-            self.process.stdin.flush()
+            self.process.stdin.write(notification)
+            await self.process.stdin.drain()
         except Exception as e:
-            print(f"Error sending MCP notification: {e}")
-
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict]:
-        """Call an MCP tool."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": 100,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
+            logger.warning("Error sending MCP notification to %s: %s", self.config.name, e)
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        cache_ttl: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """Call an MCP tool.
+
+        If ``cache_ttl`` is given, a successful response is reused for
+        identical calls within that many seconds.
+        """
+        await self._ensure_connected()
+        params = {
+            "name": tool_name,
+            "arguments": arguments
         }
-        return await self._send_request(request)
-
-    async def read_resource(self, uri: str) -> Optional[Dict]:
-        """Read an MCP resource."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": 101,
-            "method": "resources/read",
-            "params": {
-                "uri": uri
-            }
+        if cache_ttl is not None:
+            return await self._cached_request("tools/call", params, cache_ttl)
+        return await self._send_request("tools/call", params)
+
+    async def read_resource(self, uri: str, cache_ttl: Optional[float] = None) -> Optional[Dict]:
+        """Read an MCP resource, optionally reusing a cached response."""
+        await self._ensure_connected()
+        params = {
+            "uri": uri
         }
-        return await self._send_request(request)
+        if cache_ttl is not None:
+            return await self._cached_request("resources/read", params, cache_ttl)
+        return await self._send_request("resources/read", params)
 
     def get_tools(self) -> List[Dict]:
         """Get list of available tools."""
@@ -226,46 +425,150 @@ class MCPClient:
         """Get list of available resources."""
         return self._resources
 
-    def disconnect(self):
+    async def disconnect(self):
         """Stop the MCP server process."""
+        for task in (self._reader_task, self._stderr_task):
+            if task:
+                task.cancel()
+        self._reader_task = None
+        self._stderr_task = None
+        self._fail_pending(ConnectionError("MCP client disconnected"))
+
         if self.process:
-            self.process.terminate()
-            self.process = None
+            process, self.process = self.process, None
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+
+
+# All MCP subprocess I/O runs on a dedicated event loop thread, so a slow or
+# hung server can't stall request handling on the main loop
+_mcp_loop: Optional[asyncio.AbstractEventLoop] = None
+_mcp_loop_lock = threading.Lock()
+
+
+def _get_mcp_loop() -> asyncio.AbstractEventLoop:
+    """Return the MCP event loop, starting its thread on first use."""
+    global _mcp_loop
+    with _mcp_loop_lock:
+        if _mcp_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="mcp-loop", daemon=True).start()
+            _mcp_loop = loop
+    return _mcp_loop
+
+
+async def _on_mcp_loop(coro):
+    """Run a coroutine on the MCP loop and await its result from the caller's loop."""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_mcp_loop()))
+
+
+async def _gather(coros) -> list:
+    """asyncio.gather wrapper, so the gather itself is created on the MCP loop."""
+    return await asyncio.gather(*coros, return_exceptions=True)
 
 
 # Active MCP client connections
 _active_clients: Dict[str, MCPClient] = {}
 
 
+def _first_sample(text: str) -> Dict:
+    """Return the first record in a tool's JSON text result.
+
+    Handles a bare array, a paginated ``{"data": [...]}`` object, or a single
+    object. Arrays are stream-parsed with ijson so only the first item is
+    materialized, however large the payload.
+    """
+    stripped = text.lstrip()
+    if not stripped:
+        return {}
+
+    sample = None
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if ijson is not None:
+        head = stripped[:MAX_SAMPLE_PARSE_BYTES].encode()
+        prefix = "item" if stripped[0] == "[" else "data.item"
+        try:
+            sample = next(ijson.items(head, prefix, use_float=True), None)
+        except ijson.JSONError:
+            sample = None
+        if sample is None and stripped[0] == "[":
+            return {}
+
+    if sample is None:
+        # Single object (or data list empty/absent); needs the whole document
+        if len(stripped) > MAX_SAMPLE_PARSE_BYTES:
+            return {}
+        try:
+            data = json.loads(stripped)
+        except json.JSONDecodeError:
+            return {}
+        if isinstance(data, list):
+            sample = data[0] if data else {}
+        elif isinstance(data, dict):
+            # Might be paginated response
+            if "data" in data and isinstance(data["data"], list):
+                sample = data["data"][0] if data["data"] else {}
+            else:
+                sample = data
+
+    return sample if isinstance(sample, dict) else {}
+
+
+def _infer_fields(sample: Dict, server_name: str) -> List[Dict]:
+    """Build schema field entries from one sample record."""
+    description = f"Field from {server_name}"
+    type_map = _FIELD_TYPE_MAP
+    return [
+        {
+            "name": key,
+            "type": type_map.get(type(value), "string"),
+            "required": value is not None,
+            "description": description,
+        }
+        for key, value in sample.items()
+    ]
+
+
+def _parse_and_infer(text: str, server_name: str) -> List[Dict]:
+    """Parse a tool result and infer fields from its first record."""
+    sample = _first_sample(text)
+    return _infer_fields(sample, server_name) if sample else []
+
+
 @router.get("/servers")
 async def list_mcp_servers():
     """List all available MCP server configurations."""
-    servers = []
-
-    # Add predefined servers
-    for name, config in PREDEFINED_MCP_SERVERS.items():
-        servers.append({
+    # Predefined servers first, then custom configured servers
+    servers = [
+        {
+            **entry,
+            "configured": entry["name"] in MCP_SERVERS,
+            "connected": entry["name"] in _active_clients,
+        }
+        for entry in _PREDEFINED_SERVER_ENTRIES
+    ]
+    servers.extend(
+        {
             "name": config.name,
             "command": config.command,
             "args": config.args,
             "description": config.description,
-            "predefined": True,
-            "configured": name in MCP_SERVERS,
+            "predefined": False,
+            "configured": True,
             "connected": name in _active_clients,
-        })
-
-    # Add custom configured servers
-    for name, config in MCP_SERVERS.items():
-        if name not in PREDEFINED_MCP_SERVERS:
-            servers.append({
-                "name": config.name,
-                "command": config.command,
-                "args": config.args,
-                "description": config.description,
-                "predefined": False,
-                "configured": True,
-                "connected": name in _active_clients,
-            })
+        }
+        for name, config in MCP_SERVERS.items()
+        if name not in _PREDEFINED_NAMES
+    )
 
     return {"servers": servers}
 
@@ -282,7 +585,7 @@ async def remove_mcp_server(server_name: str):
     """Remove an MCP server configuration."""
     # Disconnect if connected
     if server_name in _active_clients:
-        _active_clients[server_name].disconnect()
+        await _on_mcp_loop(_active_clients[server_name].disconnect())
         del _active_clients[server_name]
 
     if server_name in MCP_SERVERS:
@@ -308,6 +611,7 @@ async def connect_mcp_server(server_name: str, api_key: Optional[str] = None, en
             args=config.args,
             env={**(config.env or {}), **(env_vars or {})},
             description=config.description,
+            max_concurrency=config.max_concurrency,
         )
         if api_key:
             # Set the appropriate API key based on server type
@@ -318,7 +622,7 @@ async def connect_mcp_server(server_name: str, api_key: Optional[str] = None, en
 
     # Create and connect client
     client = MCPClient(config)
-    connected = await client.connect()
+    connected = await _on_mcp_loop(client.connect())
 
     if connected:
         _active_clients[server_name] = client
@@ -329,16 +633,44 @@ async def connect_mcp_server(server_name: str, api_key: Optional[str] = None, en
             "resources": [r.get("uri") for r in client.get_resources()],
         }
     else:
+        # Stop a half-started process and its reader tasks before reporting
+        await _on_mcp_loop(client.disconnect())
         raise HTTPException(status_code=500, detail=f"Failed to connect to '{server_name}'")
 
 
+@router.post("/servers/connect-all")
+async def connect_all_mcp_servers():
+    """Connect every configured MCP server that is not already connected.
+
+    Servers are brought up concurrently, so total latency is that of the
+    slowest server rather than the sum.
+    """
+    clients = {
+        name: MCPClient(config)
+        for name, config in MCP_SERVERS.items()
+        if name not in _active_clients
+    }
+    results = await _on_mcp_loop(_gather([client.connect() for client in clients.values()]))
+
+    statuses = {}
+    for (name, client), result in zip(clients.items(), results):
+        if result is True:
+            _active_clients[name] = client
+            statuses[name] = "connected"
+        else:
+            await _on_mcp_loop(client.disconnect())
+            statuses[name] = "failed"
+
+    return {"servers": statuses}
+
+
 @router.post("/servers/{server_name}/disconnect")
 async def disconnect_mcp_server(server_name: str):
     """Disconnect from an MCP server."""
     if server_name not in _active_clients:
         raise HTTPException(status_code=404, detail=f"Server '{server_name}' not connected")
 
-    _active_clients[server_name].disconnect()
+    await _on_mcp_loop(_active_clients[server_name].disconnect())
     del _active_clients[server_name]
     return {"status": "disconnected", "server": server_name}
 
@@ -350,7 +682,7 @@ async def get_mcp_server_status(server_name: str) -> MCPServerStatus:
         client = _active_clients[server_name]
         return MCPServerStatus(
             name=server_name,
-            connected=True,
+            connected=client.is_alive(),
             tools=[t.get("name", "") for t in client.get_tools()],
             resources=[r.get("uri", "") for r in client.get_resources()],
         )
@@ -366,6 +698,24 @@ async def get_mcp_server_status(server_name: str) -> MCPServerStatus:
     raise HTTPException(status_code=404, detail=f"Server '{server_name}' not found")
 
 
+@router.post("/servers/{server_name}/refresh")
+async def refresh_mcp_server(server_name: str):
+    """Clear cached responses and re-list tools/resources for a server."""
+    if server_name not in _active_clients:
+        raise HTTPException(status_code=400, detail=f"Server '{server_name}' not connected")
+
+    client = _active_clients[server_name]
+    try:
+        await _on_mcp_loop(client.refresh())
+    except ConnectionError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    return {
+        "server": server_name,
+        "tools": [t.get("name") for t in client.get_tools()],
+        "resources": [r.get("uri") for r in client.get_resources()],
+    }
+
+
 @router.get("/servers/{server_name}/tools")
 async def list_mcp_tools(server_name: str):
     """List available tools from an MCP server."""
@@ -393,7 +743,10 @@ async def call_mcp_tool(request: MCPToolCall):
         raise HTTPException(status_code=400, detail=f"Server '{request.server_name}' not connected")
 
     client = _active_clients[request.server_name]
-    result = await client.call_tool(request.tool_name, request.arguments)
+    try:
+        result = await _on_mcp_loop(client.call_tool(request.tool_name, request.arguments))
+    except ConnectionError as e:
+        raise HTTPException(status_code=502, detail=str(e))
 
     if result is None:
         raise HTTPException(status_code=500, detail="Tool call failed")
@@ -408,7 +761,10 @@ async def read_mcp_resource(request: MCPResourceRequest):
         raise HTTPException(status_code=400, detail=f"Server '{request.server_name}' not connected")
 
     client = _active_clients[request.server_name]
-    result = await client.read_resource(request.resource_uri)
+    try:
+        result = await _on_mcp_loop(client.read_resource(request.resource_uri))
+    except ConnectionError as e:
+        raise HTTPException(status_code=502, detail=str(e))
 
     if result is None:
         raise HTTPException(status_code=500, detail="Resource read failed")
@@ -433,70 +789,49 @@ async def fetch_schema_from_mcp(server_name: str, entity: Optional[str] = None):
 
     # Look for tools that can list entities or describe schemas
     tools = client.get_tools()
-
-    for tool in tools:
+    candidate_tools = [
+        tool for tool in tools
+        if "list" in tool.get("name", "").lower() or "search" in tool.get("name", "").lower()
+    ]
+
+    # Call the list/search tools concurrently to get sample data
+    results = await _on_mcp_loop(_gather([
+        client.call_tool(tool.get("name", ""), {"limit": 5}, cache_ttl=SCHEMA_CACHE_TTL)
+        for tool in candidate_tools
+    ]))
+
+    for tool, result in zip(candidate_tools, results):
         tool_name = tool.get("name", "")
-        tool_desc = tool.get("description", "").lower()
-
-        # Look for list/search tools to discover entities
-        if "list" in tool_name.lower() or "search" in tool_name.lower():
-            # Try to call the tool to get sample data
-            try:
-                result = await client.call_tool(tool_name, {"limit": 5})
-                if result and "result" in result:
-                    content = result["result"].get("content", [])
-                    if content and len(content) > 0:
-                        # Try to parse the content and infer schema
-                        text_content = content[0].get("text", "")
-                        try:
-                            data = json.loads(text_content)
-                            if isinstance(data, list) and len(data) > 0:
-                                sample = data[0]
-                            elif isinstance(data, dict):
-                                # Might be paginated response
-                                if "data" in data and isinstance(data["data"], list):
-                                    sample = data["data"][0] if data["data"] else {}
-                                else:
-                                    sample = data
-                            else:
-                                sample = {}
-
-                            if sample:
-                                # Infer entity name from tool name
-                                entity_name = tool_name.replace("list_", "").replace("search_", "").replace("_", " ").title().replace(" ", "")
-
-                                fields = []
-                                for key, value in sample.items():
-                                    field_type = "string"
-                                    if isinstance(value, bool):
-                                        field_type = "boolean"
-                                    elif isinstance(value, int):
-                                        field_type = "integer"
-                                    elif isinstance(value, float):
-                                        field_type = "number"
-                                    elif isinstance(value, dict):
-                                        field_type = "object"
-                                    elif isinstance(value, list):
-                                        field_type = "array"
-
-                                    fields.append({
-                                        "name": key,
-                                        "type": field_type,
-                                        "required": value is not None,
-                                        "description": f"Field from {server_name}"
-                                    })
-
-                                schemas.append({
-                                    "service": server_name,
-                                    "entity": entity_name,
-                                    "fields": fields,
-                                    "source": f"MCP tool: {tool_name}",
-                                    "description": tool.get("description", "")
-                                })
-                        except json.JSONDecodeError:
-                            pass
-            except Exception as e:
-                print(f"Error calling tool {tool_name}: {e}")
+        if isinstance(result, Exception):
+            logger.debug("Error calling tool %s on %s: %s", tool_name, server_name, result)
+            continue
+        if not result or "result" not in result:
+            continue
+
+        content = result["result"].get("content", [])
+        if not content:
+            continue
+
+        # Parse just enough of the content to get one sample record; large
+        # payloads are parsed in a worker thread to keep the loop responsive
+        text_content = content[0].get("text", "")
+        if len(text_content) < OFFLOAD_PARSE_BYTES:
+            fields = _parse_and_infer(text_content, server_name)
+        else:
+            fields = await asyncio.to_thread(_parse_and_infer, text_content, server_name)
+        if not fields:
+            continue
+
+        # Infer entity name from tool name
+        entity_name = _TOOL_VERB_RE.sub("", tool_name).replace("_", " ").title().replace(" ", "")
+
+        schemas.append({
+            "service": server_name,
+            "entity": entity_name,
+            "fields": fields,
+            "source": f"MCP tool: {tool_name}",
+            "description": tool.get("description", "")
+        })
 
     # Also check resources for schema info
     resources = client.get_resources()
@@ -504,7 +839,7 @@ async def fetch_schema_from_mcp(server_name: str, entity: Optional[str] = None):
         uri = resource.get("uri", "")
         if "schema" in uri.lower() or "type" in uri.lower():
             try:
-                result = await client.read_resource(uri)
+                result = await _on_mcp_loop(client.read_resource(uri, cache_ttl=SCHEMA_CACHE_TTL))
                 if result and "result" in result:
                     # Process resource content
                     pass
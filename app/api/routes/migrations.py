@@ -1,8 +1,10 @@
 """Migration CRUD and execution endpoints."""
 
 import asyncio
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import functools
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
 from ..models import (
     MigrationCreate,
@@ -14,11 +16,121 @@ from ..models import (
     BatchUploadResponse,
     BatchUploadResultItem,
 )
+from ...models.migration import (
+    MigrationConfig,
+    DataSource,
+    DataSourceType,
+)
+from ...models.schema import EntityMapping, FieldMapping, MigrationMapping
+from ...services.schema_registry import SchemaRegistry
+from ...orchestrator import MigrationOrchestrator
 from ..storage import migration_storage
 from .events import migration_progress
 
 router = APIRouter()
 
+# Per-run control signals, keyed by migration id. The pause event is set while
+# the run may proceed; cancel is set once. Entries live until the run ends.
+_pause_events: Dict[str, asyncio.Event] = {}
+_cancel_events: Dict[str, asyncio.Event] = {}
+
+# In-flight run_migration_task tasks, keyed by migration id
+_migration_tasks: Dict[str, asyncio.Task] = {}
+
+# Statuses each control endpoint accepts
+_STARTABLE = frozenset({MigrationStatusEnum.DRAFT, MigrationStatusEnum.FAILED})
+_PAUSABLE = frozenset({
+    MigrationStatusEnum.EXTRACTING,
+    MigrationStatusEnum.TRANSFORMING,
+    MigrationStatusEnum.VALIDATING,
+    MigrationStatusEnum.LOADING,
+})
+
+# Internal config and mapping converted from a migration, reused across runs.
+# Dropped whenever the migration is edited or deleted.
+_run_inputs_cache: Dict[str, Tuple[MigrationConfig, MigrationMapping]] = {}
+# Bounds concurrent conversions in worker threads
+_build_slots = asyncio.Semaphore(4)
+
+# Progress is coalesced and pushed to subscribers at most this often (seconds)
+PROGRESS_FLUSH_INTERVAL = 0.25
+
+# The run phases are simulated over this many records each
+SIMULATED_RECORDS_PER_PHASE = 100
+
+# (status, status value sent to subscribers, progress message) per run phase
+_PHASES = tuple(
+    (status, status.value, message)
+    for status, message in (
+        (MigrationStatusEnum.EXTRACTING, "Extracting data from sources"),
+        (MigrationStatusEnum.TRANSFORMING, "Transforming records"),
+        (MigrationStatusEnum.VALIDATING, "Validating transformed data"),
+        (MigrationStatusEnum.LOADING, "Loading data to target"),
+    )
+)
+
+# Serialized GET bodies tagged with the storage version they were built from.
+# Polling UIs re-request these far more often than migrations change.
+_list_body_cache: Optional[Tuple[int, bytes]] = None
+# Per-migration bodies are kept in least-recently-used order, up to a cap.
+_get_body_cache: Dict[str, Tuple[int, bytes]] = {}
+GET_BODY_CACHE_SIZE = 256
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+class _ProgressAggregator:
+    """Collects per-batch counters and sends only the latest on each tick."""
+
+    def __init__(self, migration_id: str, phase: str, total_records: int, message: str):
+        self.migration_id = migration_id
+        self.phase = phase
+        self.total_records = total_records
+        self.message = message
+        self.records_processed = 0
+        self.records_failed = 0
+        self._sent = None
+        self._done = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _flush(self):
+        snapshot = (self.records_processed, self.records_failed)
+        if snapshot == self._sent:
+            return
+        self._sent = snapshot
+        await migration_progress.send_progress(
+            self.migration_id,
+            phase=self.phase,
+            records_processed=self.records_processed,
+            records_succeeded=self.records_processed - self.records_failed,
+            records_failed=self.records_failed,
+            total_records=self.total_records,
+            message=self.message,
+        )
+
+    async def _run(self):
+        while not self._done.is_set():
+            try:
+                await asyncio.wait_for(self._done.wait(), PROGRESS_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self._flush()
+
+    async def close(self):
+        """Flush the final counters and stop the ticker."""
+        self._done.set()
+        await self._task
+
+
+async def _require_migration(migration_id: str) -> MigrationResponse:
+    """Look up the path's migration once per request, or 404."""
+    migration = migration_storage.get(migration_id)
+    if not migration:
+        raise HTTPException(status_code=404, detail="Migration not found")
+    return migration
+
 
 @router.post("", response_model=MigrationResponse)
 async def create_migration(data: MigrationCreate):
@@ -29,17 +141,44 @@ async def create_migration(data: MigrationCreate):
 @router.get("", response_model=MigrationListResponse)
 async def list_migrations():
     """List all migrations."""
-    migrations = migration_storage.list_all()
-    return MigrationListResponse(migrations=migrations, total=len(migrations))
+    global _list_body_cache
+    version = migration_storage.version
+    if _list_body_cache is None or _list_body_cache[0] != version:
+        migrations = migration_storage.list_all()
+        body = MigrationListResponse(migrations=migrations, total=len(migrations)).model_dump_json()
+        _list_body_cache = (version, body.encode())
+    return _json_response(_list_body_cache[1])
+
+
+@router.get("/stream")
+async def stream_migrations():
+    """Stream all migrations as NDJSON, one record per line.
+
+    Serializes a record at a time, so large lists never sit in memory as a
+    single response body.
+    """
+    async def lines():
+        for migration in migration_storage.iter_all():
+            yield migration.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/{migration_id}", response_model=MigrationResponse)
 async def get_migration(migration_id: str):
     """Get a specific migration."""
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        raise HTTPException(status_code=404, detail="Migration not found")
-    return migration
+    version = migration_storage.version
+    cached = _get_body_cache.pop(migration_id, None)
+    if cached is None or cached[0] != version:
+        migration = migration_storage.get(migration_id)
+        if not migration:
+            raise HTTPException(status_code=404, detail="Migration not found")
+        cached = (version, migration.model_dump_json().encode())
+        if len(_get_body_cache) >= GET_BODY_CACHE_SIZE:
+            del _get_body_cache[next(iter(_get_body_cache))]
+    # Re-insert so the dict's order tracks recency
+    _get_body_cache[migration_id] = cached
+    return _json_response(cached[1])
 
 
 @router.patch("/{migration_id}", response_model=MigrationResponse)
@@ -48,6 +187,7 @@ async def update_migration(migration_id: str, data: MigrationUpdate):
     migration = migration_storage.update(migration_id, data)
     if not migration:
         raise HTTPException(status_code=404, detail="Migration not found")
+    _run_inputs_cache.pop(migration_id, None)
     return migration
 
 
@@ -56,17 +196,18 @@ async def delete_migration(migration_id: str):
     """Delete a migration."""
     if not migration_storage.delete(migration_id):
         raise HTTPException(status_code=404, detail="Migration not found")
+    _get_body_cache.pop(migration_id, None)
+    _run_inputs_cache.pop(migration_id, None)
     return {"status": "deleted"}
 
 
 @router.post("/{migration_id}/start")
-async def start_migration(migration_id: str, background_tasks: BackgroundTasks):
+async def start_migration(
+    migration_id: str,
+    migration: MigrationResponse = Depends(_require_migration),
+):
     """Start a migration run."""
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        raise HTTPException(status_code=404, detail="Migration not found")
-
-    if migration.status not in (MigrationStatusEnum.DRAFT, MigrationStatusEnum.FAILED):
+    if migration.status not in _STARTABLE:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot start migration in status: {migration.status}"
@@ -74,71 +215,77 @@ async def start_migration(migration_id: str, background_tasks: BackgroundTasks):
 
     # Update status to pending
     migration_storage.update_status(migration_id, MigrationStatusEnum.PENDING)
+    _pause_events[migration_id] = asyncio.Event()
+    _pause_events[migration_id].set()
+    _cancel_events[migration_id] = asyncio.Event()
 
     # Start migration in background
-    background_tasks.add_task(run_migration_task, migration_id)
+    _spawn_run(migration_id)
 
     return {"status": "started", "migration_id": migration_id}
 
 
 @router.post("/{migration_id}/pause")
-async def pause_migration(migration_id: str):
+async def pause_migration(
+    migration_id: str,
+    migration: MigrationResponse = Depends(_require_migration),
+):
     """Pause a running migration."""
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        raise HTTPException(status_code=404, detail="Migration not found")
-
-    if migration.status not in (
-        MigrationStatusEnum.EXTRACTING,
-        MigrationStatusEnum.TRANSFORMING,
-        MigrationStatusEnum.VALIDATING,
-        MigrationStatusEnum.LOADING,
-    ):
+    if migration.status not in _PAUSABLE:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot pause migration in status: {migration.status}"
         )
 
     migration_storage.update_status(migration_id, MigrationStatusEnum.PAUSED)
+    if migration_id in _pause_events:
+        _pause_events[migration_id].clear()
     return {"status": "paused"}
 
 
 @router.post("/{migration_id}/resume")
-async def resume_migration(migration_id: str, background_tasks: BackgroundTasks):
+async def resume_migration(
+    migration_id: str,
+    migration: MigrationResponse = Depends(_require_migration),
+):
     """Resume a paused migration."""
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        raise HTTPException(status_code=404, detail="Migration not found")
-
     if migration.status != MigrationStatusEnum.PAUSED:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot resume migration in status: {migration.status}"
         )
 
-    # Resume in background
-    background_tasks.add_task(run_migration_task, migration_id)
+    # Wake the waiting run; only start a new one if none is in flight
+    if migration_id in _pause_events:
+        _pause_events[migration_id].set()
+    else:
+        # No run survived (restart or shutdown); start one that isn't paused
+        _pause_events[migration_id] = asyncio.Event()
+        _pause_events[migration_id].set()
+        _cancel_events[migration_id] = asyncio.Event()
+        _spawn_run(migration_id)
     return {"status": "resumed"}
 
 
 @router.post("/{migration_id}/cancel")
-async def cancel_migration(migration_id: str):
+async def cancel_migration(
+    migration_id: str,
+    migration: MigrationResponse = Depends(_require_migration),
+):
     """Cancel a running migration."""
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        raise HTTPException(status_code=404, detail="Migration not found")
-
     migration_storage.update_status(migration_id, MigrationStatusEnum.CANCELLED)
+    if migration_id in _cancel_events:
+        _cancel_events[migration_id].set()
+        _pause_events[migration_id].set()
     return {"status": "cancelled"}
 
 
 @router.post("/{migration_id}/rollback")
-async def rollback_migration(migration_id: str):
+async def rollback_migration(
+    migration_id: str,
+    migration: MigrationResponse = Depends(_require_migration),
+):
     """Rollback a completed migration."""
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        raise HTTPException(status_code=404, detail="Migration not found")
-
     if migration.status != MigrationStatusEnum.COMPLETED:
         raise HTTPException(
             status_code=400,
@@ -149,120 +296,150 @@ async def rollback_migration(migration_id: str):
     return {"status": "rollback_started"}
 
 
-async def run_migration_task(migration_id: str):
-    """Background task to run migration with progress updates."""
-    from ...models.migration import (
-        MigrationConfig,
-        DataSource,
-        DataSourceType,
+@functools.lru_cache(maxsize=1)
+def _get_registry() -> SchemaRegistry:
+    """Process-wide schema registry shared by every migration run."""
+    return SchemaRegistry()
+
+
+def _build_run_inputs(migration: MigrationResponse) -> Tuple[MigrationConfig, MigrationMapping]:
+    """Convert an API migration into the internal config and mapping."""
+    # Convert API models to internal models
+    sources = []
+    for src in migration.sources:
+        source = DataSource(
+            type=DataSourceType(src.type.value),
+            name=src.name,
+            service=src.service,
+            entity=src.entity,
+            api_key=src.api_key,
+            api_endpoint=src.api_endpoint,
+            file_path=src.file_path,
+            url=src.url,
+            browser_instructions=src.browser_instructions,
+            screenshot_path=src.screenshot_path,
+            batch_size=src.batch_size,
+            rate_limit=src.rate_limit,
+            filters=src.filters,
+        )
+        sources.append(source)
+
+    config = MigrationConfig(
+        name=migration.name,
+        description=migration.description,
+        sources=sources,
+        target_service=migration.target_service,
+        target_site=migration.target_site,
+        dry_run=migration.dry_run,
+        batch_size=migration.batch_size,
     )
-    from ...models.schema import EntityMapping, FieldMapping, MigrationMapping
-    from ...services.schema_registry import SchemaRegistry
-    from ...orchestrator import MigrationOrchestrator
 
-    migration = migration_storage.get(migration_id)
-    if not migration:
-        return
+    # Build mapping from entity_mappings
+    entity_mappings = {}
+    for em in migration.entity_mappings:
+        field_mappings = []
+        for fm in em.field_mappings:
+            field_mappings.append(FieldMapping(
+                source_field=fm.source_field,
+                target_field=fm.target_field,
+                transform=fm.transform,
+                config=fm.config,
+            ))
 
-    try:
-        # Convert API models to internal models
-        sources = []
-        for src in migration.sources:
-            source = DataSource(
-                type=DataSourceType(src.type.value),
-                name=src.name,
-                service=src.service,
-                entity=src.entity,
-                api_key=src.api_key,
-                api_endpoint=src.api_endpoint,
-                file_path=src.file_path,
-                url=src.url,
-                browser_instructions=src.browser_instructions,
-                screenshot_path=src.screenshot_path,
-                batch_size=src.batch_size,
-                rate_limit=src.rate_limit,
-                filters=src.filters,
-            )
-            sources.append(source)
-
-        config = MigrationConfig(
-            name=migration.name,
-            description=migration.description,
-            sources=sources,
-            target_service=migration.target_service,
-            target_site=migration.target_site,
-            dry_run=migration.dry_run,
-            batch_size=migration.batch_size,
+        mapping_name = f"{em.source_entity}_to_{em.target_entity}"
+        entity_mappings[mapping_name] = EntityMapping(
+            source_service=em.source_service,
+            source_entity=em.source_entity,
+            target_service=em.target_service,
+            target_entity=em.target_entity,
+            field_mappings=field_mappings,
         )
 
-        # Build mapping from entity_mappings
-        entity_mappings = {}
-        for em in migration.entity_mappings:
-            field_mappings = []
-            for fm in em.field_mappings:
-                field_mappings.append(FieldMapping(
-                    source_field=fm.source_field,
-                    target_field=fm.target_field,
-                    transform=fm.transform,
-                    config=fm.config,
-                ))
-
-            mapping_name = f"{em.source_entity}_to_{em.target_entity}"
-            entity_mappings[mapping_name] = EntityMapping(
-                source_service=em.source_service,
-                source_entity=em.source_entity,
-                target_service=em.target_service,
-                target_entity=em.target_entity,
-                field_mappings=field_mappings,
-            )
+    mapping = MigrationMapping(
+        name=migration.name,
+        entity_mappings=entity_mappings,
+    )
 
-        mapping = MigrationMapping(
-            name=migration.name,
-            entity_mappings=entity_mappings,
-        )
+    return config, mapping
 
-        # Set up registry
-        registry = SchemaRegistry()
 
-        # Create orchestrator
-        orchestrator = MigrationOrchestrator(config, registry, mapping)
+async def _get_orchestrator(migration: MigrationResponse) -> MigrationOrchestrator:
+    """Return a fresh orchestrator for one run of a migration.
 
-        # Simulate migration phases with progress updates
-        phases = [
-            (MigrationStatusEnum.EXTRACTING, "Extracting data from sources"),
-            (MigrationStatusEnum.TRANSFORMING, "Transforming records"),
-            (MigrationStatusEnum.VALIDATING, "Validating transformed data"),
-            (MigrationStatusEnum.LOADING, "Loading data to target"),
-        ]
+    The converted config and mapping are cached; conversion is pure-Python
+    model construction, so a miss runs in a worker thread to keep progress
+    streams and other requests responsive. The orchestrator itself holds
+    per-run state and is never reused.
+    """
+    inputs = _run_inputs_cache.get(migration.id)
+    if inputs is None:
+        version = migration_storage.version
+        async with _build_slots:
+            inputs = await asyncio.to_thread(_build_run_inputs, migration)
+        # Don't cache a conversion whose config may have been edited meanwhile
+        if migration_storage.version == version:
+            _run_inputs_cache[migration.id] = inputs
+    config, mapping = inputs
+    return MigrationOrchestrator(config, _get_registry(), mapping)
 
-        total_records = 100  # Simulated
-        for phase_status, phase_message in phases:
-            # Check if cancelled
-            current = migration_storage.get(migration_id)
-            if current and current.status == MigrationStatusEnum.CANCELLED:
-                return
 
-            # Check if paused
-            while current and current.status == MigrationStatusEnum.PAUSED:
-                await asyncio.sleep(1)
-                current = migration_storage.get(migration_id)
-                if current and current.status == MigrationStatusEnum.CANCELLED:
-                    return
+def _spawn_run(migration_id: str):
+    """Run a migration as a tracked task on the event loop."""
+    task = asyncio.create_task(run_migration_task(migration_id))
+    _migration_tasks[migration_id] = task
+
+    def _forget(done: asyncio.Task):
+        if _migration_tasks.get(migration_id) is done:
+            del _migration_tasks[migration_id]
+
+    task.add_done_callback(_forget)
+
+
+async def cancel_running_migrations():
+    """Cancel in-flight migration runs and wait for them to unwind."""
+    tasks = list(_migration_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_migration_task(migration_id: str):
+    """Background task to run migration with progress updates."""
+    migration = migration_storage.get(migration_id)
+    if not migration:
+        return
+
+    pause_event = _pause_events.setdefault(migration_id, asyncio.Event())
+    cancel_event = _cancel_events.setdefault(migration_id, asyncio.Event())
+    if migration.status != MigrationStatusEnum.PAUSED:
+        pause_event.set()
+
+    processed = 0
+    try:
+        orchestrator = await _get_orchestrator(migration)
+
+        # Simulate migration phases with progress updates
+        total_records = SIMULATED_RECORDS_PER_PHASE
+        for phase_status, phase_value, phase_message in _PHASES:
+            # Block while paused; cancel also wakes the waiter
+            await pause_event.wait()
+            if cancel_event.is_set():
+                return
 
             migration_storage.update_status(migration_id, phase_status)
 
-            # Send progress updates
-            for i in range(0, total_records, 10):
-                await migration_progress.send_progress(
-                    migration_id,
-                    phase=phase_status.value,
-                    records_processed=i,
-                    records_succeeded=i,
-                    records_failed=0,
-                    total_records=total_records,
-                    message=phase_message,
-                )
-                await asyncio.sleep(0.1)  # Simulate work
+            # Record progress per batch; the aggregator pushes it on a timer
+            progress = _ProgressAggregator(
+                migration_id, phase_value, total_records, phase_message
+            )
+            try:
+                for i in range(0, total_records, 10):
+                    await asyncio.sleep(0)  # Yield to the event loop between batches
+                    batch = min(10, total_records - i)
+                    progress.records_processed += batch
+                    processed += batch
+            finally:
+                await progress.close()
 
             # Send step complete
             await migration_progress.send_step_complete(
@@ -273,23 +450,75 @@ async def run_migration_task(migration_id: str):
                 records_failed=0,
             )
 
-        # Mark as completed
-        migration_storage.update_status(migration_id, MigrationStatusEnum.COMPLETED)
-        updated = migration_storage.get(migration_id)
-        if updated:
-            updated.total_records_processed = total_records * len(phases)
-            updated.total_records_succeeded = total_records * len(phases)
+        # Mark as completed along with the run totals
+        migration_storage.finalize(
+            migration_id,
+            MigrationStatusEnum.COMPLETED,
+            processed=total_records * len(_PHASES),
+            succeeded=total_records * len(_PHASES),
+            failed=0,
+        )
 
         await migration_progress.send_complete(
             migration_id,
-            total_processed=total_records * len(phases),
-            total_succeeded=total_records * len(phases),
+            total_processed=total_records * len(_PHASES),
+            total_succeeded=total_records * len(_PHASES),
             total_failed=0,
         )
 
     except Exception as e:
-        migration_storage.update_status(migration_id, MigrationStatusEnum.FAILED)
+        migration_storage.finalize(
+            migration_id,
+            MigrationStatusEnum.FAILED,
+            processed=processed,
+            succeeded=processed,
+            failed=0,
+        )
         await migration_progress.send_error(migration_id, str(e))
+    finally:
+        _pause_events.pop(migration_id, None)
+        _cancel_events.pop(migration_id, None)
+
+
+# Returned as-is for empty batches (often sent as a connectivity check)
+_EMPTY_BATCH_RESPONSE = BatchUploadResponse(results=[], total=0, succeeded=0, failed=0)
+
+
+def _get_uploader(
+    request: BatchUploadRequest,
+) -> Callable[[int, Dict[str, Any]], Awaitable[str]]:
+    """Return an async ``create(idx, record) -> target_id`` for the batch target."""
+    if request.target_service.lower() == "chargebee":
+        # TODO: Integrate with actual loaders (Chargebee, API, etc.)
+        # from ...loaders.chargebee_loader import ChargebeeLoader
+        # loader = ChargebeeLoader(site=request.site, api_key=request.api_key)
+        # Loaders are blocking, so run loader.load_record via asyncio.to_thread
+        # to let calls overlap under the semaphore.
+        prefix = f"cb_{request.target_entity}_"
+    else:
+        # Generic API loader would go here
+        prefix = f"{request.target_service}_"
+
+    async def create(idx: int, record: Dict[str, Any]) -> str:
+        # Simulated success for now
+        return f"{prefix}{idx}"
+
+    return create
+
+
+async def _upload_one(
+    idx: int,
+    record: Dict[str, Any],
+    sem: asyncio.Semaphore,
+    create: Callable[[int, Dict[str, Any]], Awaitable[str]],
+) -> BatchUploadResultItem:
+    """Upload one record while holding a concurrency slot."""
+    async with sem:
+        try:
+            target_id = await create(idx, record)
+        except Exception as e:
+            return BatchUploadResultItem(source_index=idx, target_id=None, error=str(e))
+    return BatchUploadResultItem.model_construct(source_index=idx, target_id=target_id, error=None)
 
 
 @router.post("/upload-batch", response_model=BatchUploadResponse)
@@ -300,55 +529,31 @@ async def upload_batch(request: BatchUploadRequest):
     This endpoint processes records and either validates them (dry_run=True)
     or creates them in the target service (dry_run=False).
     """
-    results = []
-    succeeded = 0
-    failed = 0
-
-    for idx, record in enumerate(request.records):
-        try:
-            if request.dry_run:
-                # In dry run mode, just validate the record structure
-                # For now, we'll simulate validation success
-                results.append(BatchUploadResultItem(
-                    source_index=idx,
-                    target_id=f"dry_run_{idx}",
-                    error=None,
-                ))
-                succeeded += 1
-            else:
-                # In live mode, we would call the actual target API
-                # For now, simulate the upload
-                # TODO: Integrate with actual loaders (Chargebee, API, etc.)
-
-                if request.target_service.lower() == "chargebee":
-                    # Chargebee API integration would go here
-                    # from ...loaders.chargebee_loader import ChargebeeLoader
-                    # loader = ChargebeeLoader(site=request.site, api_key=request.api_key)
-                    # result = loader.create(request.target_entity, record)
-
-                    # Simulated success for now
-                    results.append(BatchUploadResultItem(
-                        source_index=idx,
-                        target_id=f"cb_{request.target_entity}_{idx}",
-                        error=None,
-                    ))
-                    succeeded += 1
-                else:
-                    # Generic API loader would go here
-                    results.append(BatchUploadResultItem(
-                        source_index=idx,
-                        target_id=f"{request.target_service}_{idx}",
-                        error=None,
-                    ))
-                    succeeded += 1
-
-        except Exception as e:
-            results.append(BatchUploadResultItem(
+    if not request.records:
+        return _EMPTY_BATCH_RESPONSE
+
+    if request.dry_run:
+        # In dry run mode, just validate the record structure
+        # For now, we'll simulate validation success. Nothing can fail per
+        # record and the fields are trusted, so skip validation on construction
+        results = [
+            BatchUploadResultItem.model_construct(
                 source_index=idx,
-                target_id=None,
-                error=str(e),
-            ))
-            failed += 1
+                target_id=f"dry_run_{idx}",
+                error=None,
+            )
+            for idx in range(len(request.records))
+        ]
+    else:
+        create = _get_uploader(request)
+        sem = asyncio.Semaphore(request.concurrency)
+        results = await asyncio.gather(*[
+            _upload_one(idx, record, sem, create)
+            for idx, record in enumerate(request.records)
+        ])
+
+    succeeded = sum(1 for r in results if r.error is None)
+    failed = len(results) - succeeded
 
     return BatchUploadResponse(
         results=results,
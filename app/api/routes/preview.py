@@ -1,5 +1,8 @@
 """Preview transformation endpoints."""
 
+import hashlib
+
+import orjson
 from fastapi import APIRouter, HTTPException
 
 from ..models import PreviewRequest, PreviewResponse
@@ -72,18 +75,33 @@ async def preview_transformation(data: PreviewRequest):
 
 @router.post("/batch")
 async def preview_batch_transformation(data: list[PreviewRequest]):
-    """Preview multiple record transformations."""
+    """Preview multiple record transformations.
+
+    Transforms are deterministic, so identical requests in the batch are
+    transformed once and share the result.
+    """
     results = []
+    seen: dict[bytes, PreviewResponse] = {}
     for item in data:
+        key = hashlib.blake2b(
+            orjson.dumps(item.model_dump(), option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).digest()
+        cached = seen.get(key)
+        if cached is not None:
+            results.append(cached)
+            continue
+
         try:
             result = await preview_transformation(item)
-            results.append(result)
         except HTTPException as e:
-            results.append(PreviewResponse(
+            result = PreviewResponse(
                 source_data=item.source_record,
                 transformed_data={},
                 validation_errors=[e.detail],
                 is_valid=False,
-            ))
+            )
+        seen[key] = result
+        results.append(result)
 
     return results
@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 from datetime import datetime
 import uuid
 
@@ -18,12 +18,21 @@ from .models import (
 # Path to mappings directory
 MAPPINGS_DIR = Path(__file__).parent.parent.parent / "mappings"
 
+# Statuses after which a run is over
+_TERMINAL_STATUSES = frozenset({
+    MigrationStatusEnum.COMPLETED,
+    MigrationStatusEnum.FAILED,
+    MigrationStatusEnum.CANCELLED,
+})
+
 
 class MigrationStorage:
     """In-memory storage for migrations."""
 
     def __init__(self):
         self._migrations: Dict[str, MigrationResponse] = {}
+        # Bumped on every write so readers can tell when cached views are stale
+        self.version = 0
 
     def create(self, data: MigrationCreate) -> MigrationResponse:
         migration_id = str(uuid.uuid4())
@@ -45,6 +54,7 @@ class MigrationStorage:
         )
 
         self._migrations[migration_id] = migration
+        self.version += 1
         return migration
 
     def get(self, migration_id: str) -> Optional[MigrationResponse]:
@@ -53,6 +63,10 @@ class MigrationStorage:
     def list_all(self) -> list[MigrationResponse]:
         return list(self._migrations.values())
 
+    def iter_all(self) -> Iterator[MigrationResponse]:
+        # Iterate over a snapshot so writes during iteration are safe
+        yield from tuple(self._migrations.values())
+
     def update(self, migration_id: str, data: MigrationUpdate) -> Optional[MigrationResponse]:
         migration = self._migrations.get(migration_id)
         if not migration:
@@ -65,11 +79,13 @@ class MigrationStorage:
 
         migration.updated_at = datetime.utcnow()
         self._migrations[migration_id] = migration
+        self.version += 1
         return migration
 
     def delete(self, migration_id: str) -> bool:
         if migration_id in self._migrations:
             del self._migrations[migration_id]
+            self.version += 1
             return True
         return False
 
@@ -83,12 +99,31 @@ class MigrationStorage:
 
         if status == MigrationStatusEnum.EXTRACTING and not migration.started_at:
             migration.started_at = datetime.utcnow()
-        elif status in (MigrationStatusEnum.COMPLETED, MigrationStatusEnum.FAILED, MigrationStatusEnum.CANCELLED):
+        elif status in _TERMINAL_STATUSES:
             migration.completed_at = datetime.utcnow()
 
         self._migrations[migration_id] = migration
+        self.version += 1
         return migration
 
+    def finalize(
+        self,
+        migration_id: str,
+        status: MigrationStatusEnum,
+        processed: int,
+        succeeded: int,
+        failed: int,
+    ) -> Optional[MigrationResponse]:
+        """Record a run's final counters and status in one write."""
+        migration = self._migrations.get(migration_id)
+        if not migration:
+            return None
+
+        migration.total_records_processed = processed
+        migration.total_records_succeeded = succeeded
+        migration.total_records_failed = failed
+        return self.update_status(migration_id, status)
+
 
 class MappingStorage:
     """In-memory storage for saved mappings."""
@@ -1,12 +1,14 @@
 """Interactive CLI for the service migration application."""
 
 import argparse
-import json
+import functools
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import orjson
 
 from .models.schema import (
     ServiceSchema,
@@ -16,17 +18,79 @@ from .models.schema import (
     FieldMapping,
     TransformType,
 )
-from .models.migration import (
-    MigrationConfig,
-    DataSource,
-    DataSourceType,
-)
-from .services.schema_registry import SchemaRegistry
-from .services.llm_inference import LLMSchemaInference
-from .orchestrator import MigrationOrchestrator
+
+# Command handlers import their services when run, so `--help` and light
+# commands don't load the orchestrator and extractor stack
+if TYPE_CHECKING:
+    from .services.schema_registry import SchemaRegistry
+    from .services.llm_inference import LLMSchemaInference
 
 logger = logging.getLogger(__name__)
 
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Transform choices in menu order, and by value for typed names
+_TRANSFORMS = tuple(TransformType)
+_TRANSFORMS_BY_VALUE = {t.value: t for t in _TRANSFORMS}
+
+# Static menus, rendered once
+_MAIN_MENU = "\n".join([
+    "",
+    "-" * 40,
+    "Options:",
+    "  1. List available schemas",
+    "  2. View schema details",
+    "  3. Create new mapping",
+    "  4. Edit current mapping",
+    "  5. Preview transformation",
+    "  6. Get AI mapping suggestions",
+    "  7. Save mapping to file",
+    "  8. Load mapping from file",
+    "  9. Quit",
+    "-" * 40,
+    "",
+])
+_TRANSFORM_MENU = "\n".join([
+    "",
+    "Available transforms:",
+    *(f"  {i}. {t.value}" for i, t in enumerate(_TRANSFORMS[:15], 1)),
+    "  ... (enter name for others)",
+    "",
+])
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON text; unknown types fall back to str()."""
+    return orjson.dumps(obj, default=str, option=_DUMP_OPTIONS).decode()
+
+
+def _load_json_file(path: str) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_mapping_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # Keyed on mtime and size so an edited file is re-read
+    return _load_json_file(path)
+
+
+def _read_mapping_file(path: str) -> MigrationMapping:
+    """Load a mapping file, reusing the parse while the file is unchanged.
+
+    A fresh MigrationMapping is built on every call, since the interactive
+    editor mutates the one it holds.
+    """
+    st = os.stat(path)
+    return MigrationMapping.from_dict(_parse_mapping_file(path, st.st_mtime_ns, st.st_size))
+
+
+def _write_json_file(path: str, obj: Any):
+    """Write obj to path as indented JSON."""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, default=str, option=_DUMP_OPTIONS))
+
 
 class InteractiveMappingCLI:
     """
@@ -41,8 +105,8 @@ class InteractiveMappingCLI:
 
     def __init__(
         self,
-        registry: SchemaRegistry,
-        llm_inference: Optional[LLMSchemaInference] = None
+        registry: "SchemaRegistry",
+        llm_inference: Optional["LLMSchemaInference"] = None
     ):
         """
         Initialize the interactive CLI.
@@ -89,18 +153,7 @@ class InteractiveMappingCLI:
 
     def _print_menu(self):
         """Print the main menu."""
-        print("\n" + "-" * 40)
-        print("Options:")
-        print("  1. List available schemas")
-        print("  2. View schema details")
-        print("  3. Create new mapping")
-        print("  4. Edit current mapping")
-        print("  5. Preview transformation")
-        print("  6. Get AI mapping suggestions")
-        print("  7. Save mapping to file")
-        print("  8. Load mapping from file")
-        print("  9. Quit")
-        print("-" * 40)
+        sys.stdout.write(_MAIN_MENU)
 
     def _list_schemas(self):
         """List all available schemas."""
@@ -111,10 +164,11 @@ class InteractiveMappingCLI:
             print("No schemas loaded. Load schemas using --schemas-dir")
             return
 
+        out = []
         for i, name in enumerate(schemas, 1):
             schema = self.registry.get_schema(name)
-            print(f"\n{i}. {schema.name}")
-            print(f"   Entities: {', '.join(schema.entities.keys())}")
+            out.append(f"\n{i}. {schema.name}\n   Entities: {', '.join(schema.entities.keys())}\n")
+        sys.stdout.write("".join(out))
 
     def _view_schema(self):
         """View details of a schema."""
@@ -138,21 +192,28 @@ class InteractiveMappingCLI:
 
     def _print_entity_schema(self, schema: EntitySchema):
         """Print an entity schema."""
-        print(f"\n=== {schema.name} ===")
-        print(f"Description: {schema.description}")
-        print(f"Primary Key: {schema.primary_key}")
-        print(f"\nFields ({len(schema.fields)}):")
+        # Build the whole listing and write it once; large entities have
+        # hundreds of fields
+        out = [
+            f"\n=== {schema.name} ===\n"
+            f"Description: {schema.description}\n"
+            f"Primary Key: {schema.primary_key}\n"
+            f"\nFields ({len(schema.fields)}):\n"
+        ]
+        append = out.append
 
         for name, field in schema.fields.items():
             req = "*" if field.required else " "
-            print(f"  {req} {name}: {field.type.value}", end="")
+            append(f"  {req} {name}: {field.type.value}")
             if field.max_length:
-                print(f" (max: {field.max_length})", end="")
+                append(f" (max: {field.max_length})")
             if field.enum_values:
-                print(f" [{', '.join(field.enum_values[:3])}...]", end="")
-            print()
+                append(f" [{', '.join(field.enum_values[:3])}...]")
+            append("\n")
             if field.description:
-                print(f"      {field.description[:60]}...")
+                append(f"      {field.description[:60]}...\n")
+
+        sys.stdout.write("".join(out))
 
     def _create_mapping(self):
         """Create a new entity mapping interactively."""
@@ -198,8 +259,10 @@ class InteractiveMappingCLI:
         print(f"Target: {self.current_mapping.target_service}.{self.current_mapping.target_entity}")
         print(f"\nCurrent field mappings: {len(self.current_mapping.field_mappings)}")
 
-        for i, fm in enumerate(self.current_mapping.field_mappings, 1):
-            print(f"  {i}. {fm.source_field} -> {fm.target_field} ({fm.transform.value})")
+        sys.stdout.write("".join(
+            f"  {i}. {fm.source_field} -> {fm.target_field} ({fm.transform.value})\n"
+            for i, fm in enumerate(self.current_mapping.field_mappings, 1)
+        ))
 
         while True:
             print("\nOptions: (a)dd, (r)emove, (v)iew, (d)one")
@@ -222,21 +285,17 @@ class InteractiveMappingCLI:
         if source_field.lower() == "null":
             source_field = None
 
-        print("\nAvailable transforms:")
-        transforms = list(TransformType)
-        for i, t in enumerate(transforms[:15], 1):
-            print(f"  {i}. {t.value}")
-        print("  ... (enter name for others)")
+        sys.stdout.write(_TRANSFORM_MENU)
 
         transform_input = input("Transform (number or name): ").strip()
 
-        try:
-            if transform_input.isdigit():
-                transform = transforms[int(transform_input) - 1]
-            else:
-                transform = TransformType(transform_input)
-        except (IndexError, ValueError):
-            transform = TransformType.DIRECT
+        if transform_input.isdigit():
+            try:
+                transform = _TRANSFORMS[int(transform_input) - 1]
+            except IndexError:
+                transform = TransformType.DIRECT
+        else:
+            transform = _TRANSFORMS_BY_VALUE.get(transform_input, TransformType.DIRECT)
 
         # Get transform config if needed
         config = {}
@@ -303,7 +362,7 @@ class InteractiveMappingCLI:
             print(f"Target: {fm.target_field}")
             print(f"Transform: {fm.transform.value}")
             if fm.transform_config:
-                print(f"Config: {json.dumps(fm.transform_config, indent=2)}")
+                print(f"Config: {_dumps(fm.transform_config)}")
             if fm.notes:
                 print(f"Notes: {fm.notes}")
         except (ValueError, IndexError):
@@ -318,8 +377,8 @@ class InteractiveMappingCLI:
         print("\nEnter sample source record as JSON:")
         try:
             json_input = input().strip()
-            sample_data = json.loads(json_input)
-        except json.JSONDecodeError:
+            sample_data = orjson.loads(json_input)
+        except orjson.JSONDecodeError:
             print("Invalid JSON")
             return
 
@@ -342,7 +401,7 @@ class InteractiveMappingCLI:
         )
 
         print("\n=== Transformed Result ===")
-        print(json.dumps(result.to_dict(), indent=2, default=str))
+        print(_dumps(result.to_dict()))
 
     def _suggest_mappings(self):
         """Get AI-powered mapping suggestions."""
@@ -412,8 +471,7 @@ class InteractiveMappingCLI:
             entity_mappings={self.current_mapping.name: self.current_mapping},
         )
 
-        with open(filepath, 'w') as f:
-            json.dump(mapping.to_dict(), f, indent=2)
+        _write_json_file(filepath, mapping.to_dict())
 
         print(f"Saved to {filepath}")
 
@@ -426,12 +484,11 @@ class InteractiveMappingCLI:
             return
 
         try:
-            mapping = MigrationMapping.from_json_file(filepath)
+            mapping = _read_mapping_file(filepath)
 
             if mapping.entity_mappings:
                 # Use first entity mapping
-                first_key = list(mapping.entity_mappings.keys())[0]
-                self.current_mapping = mapping.entity_mappings[first_key]
+                self.current_mapping = next(iter(mapping.entity_mappings.values()))
                 print(f"Loaded mapping: {self.current_mapping.name}")
             else:
                 print("No entity mappings found in file")
@@ -502,8 +559,11 @@ def main():
 
 def run_migration(args):
     """Run a migration from config file."""
-    with open(args.config) as f:
-        config_data = json.load(f)
+    from .models.migration import MigrationConfig
+    from .services.schema_registry import SchemaRegistry
+    from .orchestrator import MigrationOrchestrator
+
+    config_data = _load_json_file(args.config)
 
     config = MigrationConfig.from_dict(config_data)
 
@@ -518,7 +578,7 @@ def run_migration(args):
     # Load mapping
     mapping = None
     if config.mapping_file:
-        mapping = MigrationMapping.from_json_file(config.mapping_file)
+        mapping = _read_mapping_file(config.mapping_file)
 
     # Run migration
     orchestrator = MigrationOrchestrator(config, registry, mapping)
@@ -537,6 +597,9 @@ def run_migration(args):
 
 def run_interactive_mapping(args):
     """Run the interactive mapping tool."""
+    from .services.schema_registry import SchemaRegistry
+    from .services.llm_inference import LLMSchemaInference
+
     registry = SchemaRegistry(
         schemas_dir=args.schemas_dir,
         mappings_dir=args.mappings_dir,
@@ -555,10 +618,9 @@ def run_preview(args):
     from .services.transformer import TransformEngine
     from .models.record import SourceRecord
 
-    mapping = MigrationMapping.from_json_file(args.mapping)
+    mapping = _read_mapping_file(args.mapping)
 
-    with open(args.input) as f:
-        input_data = json.load(f)
+    input_data = _load_json_file(args.input)
 
     if not isinstance(input_data, list):
         input_data = [input_data]
@@ -570,29 +632,34 @@ def run_preview(args):
 
     transformer = TransformEngine()
 
-    for data in input_data:
-        record = SourceRecord(
+    records = [
+        SourceRecord(
             id=data.get("id", "preview"),
             source_service=entity_mapping.source_service,
             source_entity=entity_mapping.source_entity,
             data=data,
         )
+        for data in input_data
+    ]
+
+    results = transformer.transform_records(
+        records,
+        mapping=entity_mapping,
+        target_service=entity_mapping.target_service,
+        target_entity=entity_mapping.target_entity,
+    )
 
-        result = transformer.transform_record(
-            source_records=[record],
-            mapping=entity_mapping,
-            target_service=entity_mapping.target_service,
-            target_entity=entity_mapping.target_entity,
-        )
-
-        print(json.dumps(result.to_dict(), indent=2, default=str))
+    for result in results:
+        print(_dumps(result.to_dict()))
         print("-" * 40)
 
 
 def run_validation(args):
     """Validate a mapping."""
+    from .services.schema_registry import SchemaRegistry
+
     registry = SchemaRegistry(schemas_dir=args.schemas_dir)
-    mapping = MigrationMapping.from_json_file(args.mapping)
+    mapping = _read_mapping_file(args.mapping)
 
     print("\n=== Validating Mapping ===")
 
@@ -613,8 +680,9 @@ def run_validation(args):
 
 def run_inference(args):
     """Infer schema from sample data."""
-    with open(args.input) as f:
-        data = json.load(f)
+    from .services.llm_inference import LLMSchemaInference
+
+    data = _load_json_file(args.input)
 
     if not isinstance(data, list):
         data = [data]
@@ -627,11 +695,10 @@ def run_inference(args):
     output["notes"] = result.notes
 
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(output, f, indent=2)
+        _write_json_file(args.output, output)
         print(f"Schema saved to {args.output}")
     else:
-        print(json.dumps(output, indent=2))
+        print(_dumps(output))
 
 
 if __name__ == "__main__":
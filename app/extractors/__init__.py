@@ -1,10 +1,17 @@
 """Data extractors for various source types."""
 
+import importlib
+
 from .base import BaseExtractor, ExtractionResult
-from .api_extractor import APIExtractor
-from .csv_extractor import CSVExtractor
-from .screenshot_extractor import ScreenshotExtractor
-from .web_scraper import WebScraperExtractor
+
+# Extractors are imported on first access (PEP 562) so importing one of them,
+# or just the base classes, doesn't pull in every extractor's dependencies
+_LAZY_EXTRACTORS = {
+    "APIExtractor": ".api_extractor",
+    "CSVExtractor": ".csv_extractor",
+    "ScreenshotExtractor": ".screenshot_extractor",
+    "WebScraperExtractor": ".web_scraper",
+}
 
 __all__ = [
     "BaseExtractor",
@@ -14,3 +21,16 @@ __all__ = [
     "ScreenshotExtractor",
     "WebScraperExtractor",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXTRACTORS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -1,12 +1,23 @@
 """API-based data extractor for services like Stripe and Salesforce."""
 
+import asyncio
+import base64
+import copy
+import dataclasses
+import functools
+import importlib.util
+import threading
 import time
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlencode
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 from .base import BaseExtractor, ExtractionResult
@@ -15,6 +26,111 @@ from ..models.migration import DataSource
 
 logger = logging.getLogger(__name__)
 
+# Response codes retried by both the sync session and the async client
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Pages fetched concurrently by stream_async when no rate limit is set
+DEFAULT_PAGE_CONCURRENCY = 10
+
+# Page decoder; orjson parses large API pages several times faster than json
+_JSON_LOADS = orjson.loads
+
+# Pages this large, or of unknown length, are parsed with ijson as they
+# download instead of being buffered and decoded in one go
+STREAM_PARSE_MIN_BYTES = 1 << 20
+_STREAM_PARSE_AVAILABLE = importlib.util.find_spec("ijson") is not None
+
+# Response compressions in order of preference. Each HTTP stack advertises
+# only the ones its installed version can decode.
+_ENCODING_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+
+def _accept_encoding(supported) -> str:
+    """Accept-Encoding value for the encodings a client can decode."""
+    return ", ".join(encoding for encoding in _ENCODING_PREFERENCE if encoding in supported)
+
+
+# urllib3 builds this list from the decoders it actually has (br/zstd included)
+_SYNC_ACCEPT_ENCODING = _accept_encoding(_URLLIB3_ACCEPT_ENCODING.split(","))
+
+
+@functools.lru_cache(maxsize=1)
+def _async_accept_encoding() -> str:
+    """Accept-Encoding for the httpx client, from the decoders it registered."""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:
+        return _accept_encoding(("gzip", "deflate"))
+    return _accept_encoding(SUPPORTED_DECODERS)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Sync sessions shared by extractors hitting the same API, so pooled
+# keep-alive connections survive across extractor instances
+_shared_sessions: Dict[Tuple[Any, ...], requests.Session] = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def _wants_stream_parse(headers: Mapping[str, str]) -> bool:
+    """Whether a response body should be parsed incrementally."""
+    if not _STREAM_PARSE_AVAILABLE:
+        return False
+    length = headers.get("content-length")
+    return length is None or int(length) >= STREAM_PARSE_MIN_BYTES
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by sync threads and async tasks.
+
+    Up to ``capacity`` requests may go out back to back; after that callers
+    are spaced ``1 / rate`` seconds apart until the bucket refills.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, float(int(rate)))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait before it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def acquire_sync(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class _AsyncChunkReader:
+    """Adapts an async byte-chunk iterator to the ``read()`` ijson expects."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
 
 class APIExtractor(BaseExtractor):
     """
@@ -38,6 +154,7 @@ class APIExtractor(BaseExtractor):
             "has_more_field": "has_more",
             "data_field": "data",
             "id_field": "id",
+            "nested_unwrap": False,
         },
         "salesforce": {
             "base_url": None,  # Set dynamically based on instance
@@ -46,6 +163,7 @@ class APIExtractor(BaseExtractor):
             "next_url_field": "nextRecordsUrl",
             "data_field": "records",
             "id_field": "Id",
+            "nested_unwrap": False,
         },
         "chargebee": {
             "base_url": None,  # Set based on site
@@ -54,6 +172,7 @@ class APIExtractor(BaseExtractor):
             "offset_field": "offset",
             "data_field": "list",
             "id_field": "id",
+            "nested_unwrap": True,  # Items arrive as {"customer": {...}}
         },
     }
 
@@ -95,14 +214,36 @@ class APIExtractor(BaseExtractor):
             source: Data source configuration
             api_key: API key for authentication
             base_url: Override base URL
-            session: Custom requests session
+            session: Custom requests session; when given, extract_all() also
+                pages through it instead of the async httpx client
         """
         super().__init__(source)
         self.api_key = api_key or source.api_key
         self._base_url = base_url
-        self._session = session or self._create_session()
         self._service_config = self.SERVICE_CONFIGS.get(source.service.lower(), {})
-        self._rate_limit_delay = 1 / source.rate_limit if source.rate_limit else 0
+        self._session = session or self._get_shared_session()
+        self._session_injected = session is not None
+        self._bucket = TokenBucket(source.rate_limit) if source.rate_limit else None
+        self._concurrency = max(1, int(source.rate_limit)) if source.rate_limit else DEFAULT_PAGE_CONCURRENCY
+        self._cursor: Optional[str] = None
+        self._total_hint: Optional[int] = None
+        self._endpoint_cache: Optional[Tuple[str, Dict[str, Any], str]] = None
+        self._aclient = None  # httpx.AsyncClient, open only while streaming async
+
+    def _get_shared_session(self) -> requests.Session:
+        """Get the pooled session for this service and base URL."""
+        retry_config = self.source.retry_config
+        key = (
+            self.source.service.lower(),
+            self.base_url,
+            retry_config.get("max_retries", 3),
+            retry_config.get("backoff_factor", 2.0),
+        )
+        with _shared_sessions_lock:
+            session = _shared_sessions.get(key)
+            if session is None:
+                session = _shared_sessions[key] = self._create_session()
+        return session
 
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry logic."""
@@ -112,16 +253,39 @@ class APIExtractor(BaseExtractor):
         retries = Retry(
             total=retry_config.get("max_retries", 3),
             backoff_factor=retry_config.get("backoff_factor", 2.0),
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=sorted(_RETRY_STATUSES),
         )
 
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = HTTPAdapter(
+            max_retries=retries,
+            pool_connections=64,
+            pool_maxsize=64,
+            pool_block=False,
+        )
+        session.headers["Connection"] = "keep-alive"
+        session.headers["Accept-Encoding"] = _SYNC_ACCEPT_ENCODING
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
         return session
 
-    @property
+    def _create_async_client(self):
+        """Create an httpx client with pooled connections for async paging."""
+        # Imported here so httpx stays off the sync extraction path
+        import httpx
+
+        transport = httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            retries=self.source.retry_config.get("max_retries", 3),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=30.0,
+            headers={"Accept-Encoding": _async_accept_encoding()},
+        )
+
+    @functools.cached_property
     def base_url(self) -> str:
         """Get the base URL for API requests."""
         if self._base_url:
@@ -138,6 +302,21 @@ class APIExtractor(BaseExtractor):
 
         return self._service_config.get("base_url", self.source.api_endpoint or "")
 
+    @functools.cached_property
+    def auth_headers(self) -> Dict[str, str]:
+        """Authentication headers, built once per extractor."""
+        return self._get_auth_headers()
+
+    @property
+    def endpoint_url(self) -> str:
+        """Full URL for the current entity, rebuilt only when entity or filters change."""
+        source = self.source
+        cached = self._endpoint_cache
+        if cached is None or cached[0] != source.entity or cached[1] != source.filters:
+            url = f"{self.base_url}{self._get_endpoint(source.entity)}"
+            cached = self._endpoint_cache = (source.entity, dict(source.filters), url)
+        return cached[2]
+
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers based on service type."""
         auth_type = self._service_config.get("auth_type", "bearer")
@@ -145,8 +324,7 @@ class APIExtractor(BaseExtractor):
         if auth_type == "bearer":
             return {"Authorization": f"Bearer {self.api_key}"}
         elif auth_type == "basic":
-            import base64
-            credentials = base64.b64encode(f"{self.api_key}:".encode()).decode()
+            credentials = base64.b64encode(f"{self.api_key}:".encode()).decode("ascii")
             return {"Authorization": f"Basic {credentials}"}
 
         return {}
@@ -166,8 +344,22 @@ class APIExtractor(BaseExtractor):
         # Default pattern
         return f"/{entity.lower()}"
 
+    def _run_async(self) -> bool:
+        """Whether extract_all() should fan out over the async client via asyncio.run."""
+        if self._session_injected:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+
     def extract(self) -> ExtractionResult:
-        """Extract all data from the API."""
+        """Extract all data from the API.
+
+        Pages through the pooled requests session, so keep-alive connections
+        carry over between back-to-back extractions of the same API.
+        """
         self.reset()
         started_at = datetime.utcnow()
         all_records = []
@@ -175,49 +367,330 @@ class APIExtractor(BaseExtractor):
         try:
             for batch in self.stream():
                 all_records.extend(batch)
+            logger.info(f"Extracted {len(all_records)} {self.source.entity} records from {self.source.service}")
+        except Exception as e:
+            self.add_error(f"Extraction failed: {str(e)}")
 
-            result = self.get_extraction_result(all_records)
-            result.started_at = started_at
-            result.completed_at = datetime.utcnow()
+        return self._finish_extraction(all_records, started_at)
 
-            logger.info(f"Extracted {len(all_records)} {self.source.entity} records from {self.source.service}")
-            return result
+    async def extract_async(self) -> ExtractionResult:
+        """Extract all data from the API, fetching pages concurrently."""
+        self.reset()
+        started_at = datetime.utcnow()
+        all_records: List[SourceRecord] = []
+        count = 0
 
+        try:
+            async for batch in self.stream_async():
+                # Size the list once when the server reported a total
+                if not count and self._total_hint:
+                    all_records = [None] * self._total_hint
+                all_records[count:count + len(batch)] = batch
+                count += len(batch)
+            logger.info(f"Extracted {count} {self.source.entity} records from {self.source.service}")
         except Exception as e:
             self.add_error(f"Extraction failed: {str(e)}")
-            result = self.get_extraction_result(all_records)
-            result.started_at = started_at
-            result.completed_at = datetime.utcnow()
-            return result
+        finally:
+            del all_records[count:]
+
+        return self._finish_extraction(all_records, started_at)
+
+    def _finish_extraction(self, all_records: List[SourceRecord], started_at: datetime) -> ExtractionResult:
+        """Build the extraction result once paging has stopped."""
+        result = self.get_extraction_result(all_records)
+        result.started_at = started_at
+        result.completed_at = datetime.utcnow()
+        return result
 
     def extract_batch(self, offset: int = 0, limit: int = 100) -> List[SourceRecord]:
         """Extract a batch of records from the API."""
-        try:
-            endpoint = self._get_endpoint(self.source.entity)
-            url = f"{self.base_url}{endpoint}"
-            headers = self._get_auth_headers()
+        data = self._fetch_page(params=self._build_params(offset, limit))
+        if data is None:
+            return []
 
-            # Build query parameters
-            params = self._build_params(offset, limit)
+        if offset == 0:
+            self._total_hint = self._get_total_hint(data)
+        return self._parse_response(data)
 
+    def _fetch_page(
+        self,
+        url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """GET one page through the pooled session; None (with an error recorded) on failure."""
+        try:
             # Apply rate limiting
-            if self._rate_limit_delay > 0:
-                time.sleep(self._rate_limit_delay)
+            if self._bucket is not None:
+                self._bucket.acquire_sync()
 
-            response = self._session.get(url, headers=headers, params=params)
-            response.raise_for_status()
+            with self._session.get(
+                url or self.endpoint_url, headers=self.auth_headers, params=params, stream=True
+            ) as response:
+                response.raise_for_status()
 
-            data = response.json()
-            records = self._parse_response(data)
+                if _wants_stream_parse(response.headers):
+                    import ijson
 
-            return records
+                    response.raw.decode_content = True
+                    return dict(ijson.kvitems(response.raw, "", use_float=True))
+                return _JSON_LOADS(response.content)
 
         except requests.exceptions.HTTPError as e:
             self.add_error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            return []
+            return None
         except Exception as e:
             self.add_error(f"Request failed: {str(e)}")
+            return None
+
+    def stream(self, batch_size: Optional[int] = None) -> Iterator[List[SourceRecord]]:
+        """
+        Stream records in batches.
+
+        Offset pagination switches to parallel_pages once the first page
+        reports a total count; otherwise pages are fetched one by one.
+        Cursor and next-URL pagination follow the link in each page.
+        """
+        batch_size = batch_size or self.source.batch_size
+        self._total_hint = None
+        if self._service_config.get("pagination_type", "offset") != "offset":
+            yield from self._stream_linked_pages_sync(batch_size)
+            return
+
+        batches = super().stream(batch_size)
+
+        first = next(batches, None)
+        if first is None:
+            return
+        yield first
+
+        if self._total_hint is None or len(first) < batch_size:
+            yield from batches
+            return
+        batches.close()
+        yield from self.parallel_pages(self._total_hint, batch_size, start=batch_size)
+
+    def _stream_linked_pages_sync(self, batch_size: int) -> Iterator[List[SourceRecord]]:
+        """Follow cursor/next-URL pagination through the pooled session."""
+        self._cursor = None
+        url, params = None, self._build_params(0, batch_size)
+        while True:
+            data = self._fetch_page(url, params)
+            if data is None:
+                return
+
+            next_page = self._next_page_request(data, batch_size)
+            batch = self._parse_response(data)
+            if batch:
+                yield batch
+            if next_page is None:
+                return
+            url, params = next_page
+
+    def parallel_pages(
+        self,
+        total: int,
+        batch_size: int,
+        start: int = 0,
+        workers: Optional[int] = None
+    ) -> Iterator[List[SourceRecord]]:
+        """
+        Fetch the offset pages in ``[start, total)`` on a thread pool.
+
+        Batches are yielded in offset order. The pooled requests session and
+        the rate-limit token bucket are shared by the workers.
+        """
+        offsets = range(start, total, batch_size)
+        with ThreadPoolExecutor(max_workers=workers or self._concurrency) as pool:
+            for batch in pool.map(lambda offset: self.extract_batch(offset, batch_size), offsets):
+                if batch:
+                    yield batch
+
+    async def extract_batch_async(self, offset: int = 0, limit: int = 100) -> List[SourceRecord]:
+        """Extract a batch of records from the API without blocking the loop."""
+        data = await self._fetch_page_async(params=self._build_params(offset, limit))
+        if data is None:
             return []
+        return self._parse_response(data)
+
+    async def _fetch_page_async(
+        self,
+        url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """GET one page, retrying throttled/5xx responses; None on failure."""
+        import httpx
+
+        if url is None:
+            url = self.endpoint_url
+        if params:
+            # httpx replaces the URL's query with params; requests merges them,
+            # and endpoints such as Salesforce's SOQL carry a query already
+            url = httpx.URL(url).copy_merge_params(params)
+        headers = self.auth_headers
+        retry_config = self.source.retry_config
+        max_retries = retry_config.get("max_retries", 3)
+        backoff_factor = retry_config.get("backoff_factor", 2.0)
+
+        owns_client = self._aclient is None
+        client = self._aclient or self._create_async_client()
+        try:
+            for attempt in range(max_retries + 1):
+                if self._bucket is not None:
+                    await self._bucket.acquire()
+
+                async with client.stream("GET", url, headers=headers) as response:
+                    if response.status_code in _RETRY_STATUSES and attempt < max_retries:
+                        retry_after = backoff_factor * (2 ** attempt)
+                    elif not response.is_success:
+                        await response.aread()
+                        response.raise_for_status()
+                    elif _wants_stream_parse(response.headers):
+                        import ijson
+
+                        reader = _AsyncChunkReader(response.aiter_bytes())
+                        return {
+                            key: value
+                            async for key, value in ijson.kvitems_async(reader, "", use_float=True)
+                        }
+                    else:
+                        return _JSON_LOADS(await response.aread())
+
+                await asyncio.sleep(retry_after)
+
+        except httpx.HTTPStatusError as e:
+            self.add_error(f"HTTP error: {e.response.status_code} - {e.response.text}")
+        except Exception as e:
+            self.add_error(f"Request failed: {str(e)}")
+        finally:
+            if owns_client:
+                await client.aclose()
+        return None
+
+    async def stream_async(
+        self,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[SourceRecord]]:
+        """
+        Async stream records in batches.
+
+        Offset pagination fetches up to ``rate_limit`` pages at once; cursor
+        and URL pagination stay sequential but request the next page before
+        building records for the current one.
+        """
+        batch_size = batch_size or self.source.batch_size
+        self._total_hint = None
+        owns_client = self._aclient is None
+        if owns_client:
+            self._aclient = self._create_async_client()
+
+        try:
+            if self._service_config.get("pagination_type", "offset") == "offset":
+                pages = self._stream_offset_pages(batch_size)
+            else:
+                pages = self._stream_linked_pages(batch_size)
+            async for batch in pages:
+                yield batch
+        finally:
+            if owns_client:
+                await self._aclient.aclose()
+                self._aclient = None
+
+    async def _stream_offset_pages(self, batch_size: int) -> AsyncIterator[List[SourceRecord]]:
+        """Fetch offset pages concurrently, windowed by the page concurrency."""
+        first = await self._fetch_page_async(params=self._build_params(0, batch_size))
+        if first is None:
+            return
+        total = self._total_hint = self._get_total_hint(first)
+        batch = self._parse_response(first)
+        if not batch:
+            return
+        yield batch
+        if len(batch) < batch_size:
+            return
+
+        slots = asyncio.Semaphore(self._concurrency)
+
+        async def fetch(page_offset: int) -> List[SourceRecord]:
+            async with slots:
+                return await self.extract_batch_async(page_offset, batch_size)
+
+        offset = batch_size
+        while total is None or offset < total:
+            stop = offset + self._concurrency * batch_size
+            if total is not None:
+                stop = min(stop, total)
+            window = range(offset, stop, batch_size)
+
+            for batch in await asyncio.gather(*(fetch(o) for o in window)):
+                if not batch:
+                    return
+                yield batch
+                if len(batch) < batch_size:
+                    return
+            offset = stop
+
+    async def _stream_linked_pages(self, batch_size: int) -> AsyncIterator[List[SourceRecord]]:
+        """Follow cursor/next-URL pagination, overlapping parse with the next fetch."""
+        self._cursor = None
+        pending = asyncio.ensure_future(
+            self._fetch_page_async(params=self._build_params(0, batch_size))
+        )
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+                if data is None:
+                    return
+
+                next_page = self._next_page_request(data, batch_size)
+                if next_page is not None:
+                    url, params = next_page
+                    pending = asyncio.ensure_future(self._fetch_page_async(url, params))
+                    # Let the request go out before parsing this page
+                    await asyncio.sleep(0)
+
+                batch = self._parse_response(data)
+                if batch:
+                    yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def _next_page_request(
+        self,
+        data: Dict[str, Any],
+        batch_size: int
+    ) -> Optional[Tuple[Optional[str], Optional[Dict[str, Any]]]]:
+        """Work out the (url, params) of the page after ``data``, if any."""
+        items = data.get(self._service_config.get("data_field", "data"))
+        if not items or not isinstance(items, list):
+            return None
+
+        if self._service_config.get("pagination_type") == "url":
+            next_url = data.get(self._service_config.get("next_url_field", "next"))
+            return (f"{self.base_url}{next_url}", None) if next_url else None
+
+        has_more_field = self._service_config.get("has_more_field")
+        has_more = data.get(has_more_field, False) if has_more_field else len(items) >= batch_size
+        if not has_more:
+            return None
+
+        last = items[-1]
+        if self._service_config.get("nested_unwrap", True) and len(last) == 1:
+            only = next(iter(last.values()))
+            if isinstance(only, dict):
+                last = only
+        self._cursor = last.get(self._service_config.get("id_field", "id"))
+        return None, self._build_params(0, batch_size)
+
+    @staticmethod
+    def _get_total_hint(data: Dict[str, Any]) -> Optional[int]:
+        """Read a server-reported total record count, when one is present."""
+        for key in ("total_count", "count"):
+            value = data.get(key)
+            if isinstance(value, int):
+                return value
+        return None
 
     def _build_params(self, offset: int, limit: int) -> Dict[str, Any]:
         """Build query parameters for the request."""
@@ -231,7 +704,7 @@ class APIExtractor(BaseExtractor):
         if pagination_type == "offset":
             offset_field = self._service_config.get("offset_field", "offset")
             params[offset_field] = offset
-        elif pagination_type == "cursor" and hasattr(self, "_cursor"):
+        elif pagination_type == "cursor" and self._cursor is not None:
             cursor_field = self._service_config.get("cursor_field", "starting_after")
             params[cursor_field] = self._cursor
 
@@ -241,27 +714,31 @@ class APIExtractor(BaseExtractor):
         """Parse API response into SourceRecords."""
         data_field = self._service_config.get("data_field", "data")
         id_field = self._service_config.get("id_field", "id")
+        unwrap = self._service_config.get("nested_unwrap", True)
 
-        records = []
         items = data.get(data_field, [])
 
         if not isinstance(items, list):
             items = [items]
 
-        for item in items:
+        make_record = self.record_factory()
+        records = [None] * len(items)
+        record_id = None
+        for idx, item in enumerate(items):
             # Handle nested objects (e.g., Chargebee returns {"customer": {...}})
-            if len(item) == 1 and isinstance(list(item.values())[0], dict):
-                item = list(item.values())[0]
-
-            record_id = item.get(id_field, str(len(records)))
-            record = self.create_record(
-                id=record_id,
-                data=item,
-                raw_data=item,
-            )
-            records.append(record)
-
-            # Store cursor for pagination
+            wrapper = None
+            if unwrap and len(item) == 1:
+                only = next(iter(item.values()))
+                if isinstance(only, dict):
+                    wrapper, item = item, only
+
+            # data is the API object as returned, so only keep raw_data when
+            # unwrapping changed its shape instead of holding it twice
+            record_id = item.get(id_field, idx)
+            records[idx] = make_record(id=str(record_id), data=item, raw_data=wrapper)
+
+        # Store cursor for pagination
+        if records:
             self._cursor = record_id
 
         # Check for more data
@@ -273,6 +750,44 @@ class APIExtractor(BaseExtractor):
 
         return records
 
+    def _for_entity(self, entity: str) -> "APIExtractor":
+        """Copy of this extractor pointed at another entity, sharing its session."""
+        clone = copy.copy(self)
+        clone.source = dataclasses.replace(self.source, entity=entity, filters={})
+        clone.reset()
+        clone._cursor = None
+        clone._total_hint = None
+        clone._endpoint_cache = None
+        clone._aclient = None
+        return clone
+
+    def _extract_entities(self, entities: Dict[str, str]) -> Dict[str, List[SourceRecord]]:
+        """Extract several entities, concurrently unless already inside an event loop."""
+        if self._run_async():
+            return asyncio.run(self._extract_entities_async(entities))
+
+        results = {}
+        for name, entity in entities.items():
+            result = self._for_entity(entity).extract()
+            self._errors.extend(result.errors)
+            results[name] = result.records
+        return results
+
+    async def _extract_entities_async(self, entities: Dict[str, str]) -> Dict[str, List[SourceRecord]]:
+        """Extract several entities at once over one pooled async client."""
+        extractors = [self._for_entity(entity) for entity in entities.values()]
+        client = self._create_async_client()
+        try:
+            for extractor in extractors:
+                extractor._aclient = client
+            results = await asyncio.gather(*(e.extract_async() for e in extractors))
+        finally:
+            await client.aclose()
+
+        for result in results:
+            self._errors.extend(result.errors)
+        return {name: result.records for name, result in zip(entities, results)}
+
     def validate_source(self) -> List[str]:
         """Validate the API source configuration."""
         errors = super().validate_source()
@@ -289,6 +804,14 @@ class APIExtractor(BaseExtractor):
 class StripeExtractor(APIExtractor):
     """Specialized extractor for Stripe API."""
 
+    # Result key -> entity for extract_all
+    ALL_ENTITIES = {
+        "customers": "customers",
+        "products": "products",
+        "prices": "prices",
+        "subscriptions": "subscriptions",
+    }
+
     def __init__(
         self,
         source: DataSource,
@@ -322,18 +845,55 @@ class StripeExtractor(APIExtractor):
         return self.extract().records
 
     def extract_all(self) -> Dict[str, List[SourceRecord]]:
-        """Extract all entity types."""
-        return {
-            "customers": self.extract_customers(),
-            "products": self.extract_products(),
-            "prices": self.extract_prices(),
-            "subscriptions": self.extract_subscriptions(),
-        }
+        """Extract all entity types concurrently."""
+        return self._extract_entities(self.ALL_ENTITIES)
+
+    async def extract_all_async(self) -> Dict[str, List[SourceRecord]]:
+        """Extract all entity types concurrently."""
+        return await self._extract_entities_async(self.ALL_ENTITIES)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_soql_where(signature: Tuple[Tuple[str, bool], ...]) -> str:
+    """Build a str.format template for a WHERE clause from (field, is_string) pairs."""
+    clauses = []
+    for field, is_string in signature:
+        field = field.replace("{", "{{").replace("}", "}}")
+        clauses.append(f"{field} = '{{}}'" if is_string else f"{field} = {{}}")
+    return " AND ".join(clauses)
+
+
+def _soql_literal(value: Any) -> str:
+    """Render a filter value for a WHERE clause slot."""
+    if isinstance(value, str):
+        # Escape backslashes and quotes so values cannot close the literal
+        return value.replace("\\", "\\\\").replace("'", "\\'")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
 
 
 class SalesforceExtractor(APIExtractor):
     """Specialized extractor for Salesforce API."""
 
+    # Result key -> entity for extract_all
+    ALL_ENTITIES = {
+        "accounts": "Account",
+        "contacts": "Contact",
+        "leads": "Lead",
+        "opportunities": "Opportunity",
+    }
+
+    # Common fields for each entity type
+    ENTITY_FIELDS = {
+        "account": "Id, Name, Type, Industry, Phone, Website, BillingStreet, BillingCity, BillingState, BillingPostalCode, BillingCountry, CreatedDate",
+        "contact": "Id, AccountId, FirstName, LastName, Email, Phone, MailingStreet, MailingCity, MailingState, MailingPostalCode, MailingCountry, CreatedDate",
+        "lead": "Id, FirstName, LastName, Company, Email, Phone, Street, City, State, PostalCode, Country, Status, CreatedDate",
+        "opportunity": "Id, AccountId, Name, Amount, StageName, CloseDate, Type, CreatedDate",
+    }
+
     def __init__(
         self,
         source: DataSource,
@@ -350,28 +910,17 @@ class SalesforceExtractor(APIExtractor):
         query = f"SELECT {fields} FROM {entity}"
 
         # Add filters
-        if self.source.filters:
-            where_clauses = []
-            for field, value in self.source.filters.items():
-                if isinstance(value, str):
-                    where_clauses.append(f"{field} = '{value}'")
-                else:
-                    where_clauses.append(f"{field} = {value}")
-            if where_clauses:
-                query += f" WHERE {' AND '.join(where_clauses)}"
-
-        return f"/services/data/v59.0/query?q={query.replace(' ', '+')}"
+        filters = self.source.filters
+        if filters:
+            signature = tuple((field, isinstance(value, str)) for field, value in filters.items())
+            values = [_soql_literal(value) for value in filters.values()]
+            query += f" WHERE {_compile_soql_where(signature).format(*values)}"
+
+        return f"/services/data/v59.0/query?{urlencode({'q': query})}"
 
     def _get_entity_fields(self, entity: str) -> str:
         """Get field list for an entity."""
-        # Common fields for each entity type
-        entity_fields = {
-            "account": "Id, Name, Type, Industry, Phone, Website, BillingStreet, BillingCity, BillingState, BillingPostalCode, BillingCountry, CreatedDate",
-            "contact": "Id, AccountId, FirstName, LastName, Email, Phone, MailingStreet, MailingCity, MailingState, MailingPostalCode, MailingCountry, CreatedDate",
-            "lead": "Id, FirstName, LastName, Company, Email, Phone, Street, City, State, PostalCode, Country, Status, CreatedDate",
-            "opportunity": "Id, AccountId, Name, Amount, StageName, CloseDate, Type, CreatedDate",
-        }
-        return entity_fields.get(entity.lower(), "Id, Name, CreatedDate")
+        return self.ENTITY_FIELDS.get(entity.lower(), "Id, Name, CreatedDate")
 
     def extract_accounts(self, **filters) -> List[SourceRecord]:
         """Extract all accounts."""
@@ -398,10 +947,9 @@ class SalesforceExtractor(APIExtractor):
         return self.extract().records
 
     def extract_all(self) -> Dict[str, List[SourceRecord]]:
-        """Extract all entity types."""
-        return {
-            "accounts": self.extract_accounts(),
-            "contacts": self.extract_contacts(),
-            "leads": self.extract_leads(),
-            "opportunities": self.extract_opportunities(),
-        }
+        """Extract all entity types concurrently."""
+        return self._extract_entities(self.ALL_ENTITIES)
+
+    async def extract_all_async(self) -> Dict[str, List[SourceRecord]]:
+        """Extract all entity types concurrently."""
+        return await self._extract_entities_async(self.ALL_ENTITIES)
@@ -2,17 +2,31 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Dict, List, Optional, Iterator
-from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Iterator
+from datetime import datetime, timedelta
+import functools
 import logging
+import time
+
+import orjson
 
 from ..models.record import SourceRecord
 from ..models.migration import DataSource
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _format_error_timestamps(errors: List[Dict[str, Any]]) -> None:
+    """Turn the raw ``timestamp_ns`` recorded by add_error into ISO ``timestamp``."""
+    for error in errors:
+        timestamp_ns = error.pop("timestamp_ns", None)
+        if timestamp_ns is not None:
+            error["timestamp"] = (_EPOCH + timedelta(microseconds=timestamp_ns // 1000)).isoformat()
 
-@dataclass
+
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of an extraction operation."""
     source: DataSource
@@ -49,6 +63,14 @@ class ExtractionResult:
             "metadata": self.metadata,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes with orjson (error details may hold datetimes or other objects)."""
+        return orjson.dumps(
+            self.to_dict(),
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        )
+
 
 class BaseExtractor(ABC):
     """
@@ -166,7 +188,7 @@ class BaseExtractor(ABC):
         Args:
             id: Record identifier
             data: Processed record data
-            raw_data: Original unprocessed data
+            raw_data: Original unprocessed data, only when it differs from data
             metadata: Additional metadata
 
         Returns:
@@ -183,6 +205,23 @@ class BaseExtractor(ABC):
             metadata=metadata or {},
         )
 
+    def record_factory(self) -> Callable[..., SourceRecord]:
+        """
+        Get a SourceRecord constructor with this source's fields bound.
+
+        Per-record loops call it with ``id`` (already a string), ``data``
+        and optionally ``raw_data``/``metadata`` instead of going through
+        create_record, so the source configuration is read once per batch.
+        """
+        source = self.source
+        return functools.partial(
+            SourceRecord,
+            source_service=source.service,
+            source_entity=source.entity,
+            source_type=source.type.value,
+            source_file=source.file_path,
+        )
+
     def add_error(
         self,
         message: str,
@@ -193,7 +232,8 @@ class BaseExtractor(ABC):
         error = {
             "message": message,
             "record_id": record_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            # Formatted once, when the extraction result is built
+            "timestamp_ns": time.time_ns(),
         }
         if details:
             error.update(details)
@@ -215,6 +255,7 @@ class BaseExtractor(ABC):
         Returns:
             ExtractionResult object
         """
+        _format_error_timestamps(self._errors)
         return ExtractionResult(
             source=self.source,
             records=records,
@@ -1,12 +1,17 @@
 """CSV/JSON file-based data extractor."""
 
+import codecs
 import csv
-import json
 import logging
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 from datetime import datetime
 import glob as globmodule
+import itertools
+
+import orjson
 
 from .base import BaseExtractor, ExtractionResult
 from ..models.record import SourceRecord
@@ -14,6 +19,94 @@ from ..models.migration import DataSource
 
 logger = logging.getLogger(__name__)
 
+# How many upcoming files get a readahead hint while the current one is parsed
+PREFETCH_FILES = 16
+_FADV_WILLNEED = getattr(os, "POSIX_FADV_WILLNEED", None)
+
+# Lowercased literal tokens recognised by _infer_type
+_LITERAL_TOKENS: Dict[str, Optional[bool]] = {
+    **dict.fromkeys(("true", "yes", "1"), True),
+    **dict.fromkeys(("false", "no", "0"), False),
+    **dict.fromkeys(("null", "none", "n/a", "na"), None),
+}
+# ASCII first characters of anything int()/float() can parse (digits, signs, ".5", inf, nan)
+_NUMERIC_START = frozenset("0123456789+-.iInN")
+_NO_TOKEN = object()
+
+
+
+class _DelimiterSniffer(csv.Sniffer):
+    """csv.Sniffer that builds its character frequency tables with one Counter per line.
+
+    The stdlib version calls line.count() for each of the 127 ASCII characters
+    on every line; the resulting tables (and so the detected delimiter) are the same.
+    """
+
+    def _guess_delimiter(self, data, delimiters):
+        data = list(filter(None, data.split("\n")))
+        ascii = [chr(c) for c in range(127)]  # 7-bit ASCII
+
+        # build frequency tables
+        chunk_length = min(10, len(data))
+        iteration = 0
+        char_frequency: Dict[str, Dict[int, int]] = {char: {} for char in ascii}
+        modes = {}
+        delims = {}
+        start, end = 0, chunk_length
+        while start < len(data):
+            iteration += 1
+            for line in data[start:end]:
+                counts = Counter(line)
+                for char in ascii:
+                    meta_frequency = char_frequency[char]
+                    # must count even if frequency is 0
+                    freq = counts.get(char, 0)
+                    meta_frequency[freq] = meta_frequency.get(freq, 0) + 1
+
+            for char, meta_frequency in char_frequency.items():
+                items = list(meta_frequency.items())
+                if len(items) == 1 and items[0][0] == 0:
+                    continue
+                # get the mode of the frequencies, less the sum of all other frequencies
+                if len(items) > 1:
+                    mode = max(items, key=lambda x: x[1])
+                    items.remove(mode)
+                    modes[char] = (mode[0], mode[1] - sum(item[1] for item in items))
+                else:
+                    modes[char] = items[0]
+
+            # build a list of possible delimiters
+            total = float(min(chunk_length * iteration, len(data)))
+            consistency = 1.0
+            threshold = 0.9
+            while not delims and consistency >= threshold:
+                for k, v in modes.items():
+                    if v[0] > 0 and v[1] > 0:
+                        if v[1] / total >= consistency and (delimiters is None or k in delimiters):
+                            delims[k] = v
+                consistency -= 0.01
+
+            if len(delims) == 1:
+                delim = next(iter(delims))
+                return delim, data[0].count(delim) == data[0].count(f"{delim} ")
+
+            # analyze another chunk_length lines
+            start = end
+            end += chunk_length
+
+        if not delims:
+            return "", 0
+
+        # if there's more than one, fall back to a 'preferred' list
+        if len(delims) > 1:
+            for d in self.preferred:
+                if d in delims:
+                    return d, data[0].count(d) == data[0].count(f"{d} ")
+
+        # nothing else indicates a preference, pick the character that dominates
+        delim = max((v, k) for k, v in delims.items())[1]
+        return delim, data[0].count(delim) == data[0].count(f"{delim} ")
+
 
 class CSVExtractor(BaseExtractor):
     """
@@ -33,7 +126,9 @@ class CSVExtractor(BaseExtractor):
         column_mapping: Optional[Dict[str, str]] = None,
         id_column: Optional[str] = None,
         encoding: str = "utf-8",
-        delimiter: str = ","
+        delimiter: Optional[str] = None,
+        use_arrow: bool = False,
+        sniff_delimiter: Optional[bool] = None
     ):
         """
         Initialize the CSV extractor.
@@ -43,14 +138,25 @@ class CSVExtractor(BaseExtractor):
             column_mapping: Optional mapping of CSV columns to field names
             id_column: Column to use as record ID
             encoding: File encoding
-            delimiter: CSV delimiter character
+            delimiter: CSV delimiter character (defaults to ",")
+            use_arrow: Tokenize CSV files with pyarrow's multithreaded reader
+                instead of csv.DictReader; records are identical (requires pyarrow)
+            sniff_delimiter: Detect the delimiter from each directory's first
+                file; defaults to True only when no delimiter is given
         """
         super().__init__(source)
         self.column_mapping = column_mapping or {}
         self.id_column = id_column or "id"
         self.encoding = encoding
-        self.delimiter = delimiter
+        self.delimiter = delimiter or ","
+        self.sniff_delimiter = delimiter is None if sniff_delimiter is None else sniff_delimiter
+        self.use_arrow = use_arrow
         self._current_file = None
+        # Delimiters detected per (directory, suffix), reused across globbed files
+        self._sniffed_delimiters: Dict[Tuple[Path, str], str] = {}
+        self._make_record = self.record_factory()
+        # orjson decodes UTF-8 bytes directly; other encodings are read as text
+        self._read_mode = "rb" if codecs.lookup(encoding).name == "utf-8" else "r"
 
     def extract(self) -> ExtractionResult:
         """Extract all data from CSV/JSON files."""
@@ -65,16 +171,7 @@ class CSVExtractor(BaseExtractor):
                 self.add_warning(f"No files found matching: {self.source.file_path or self.source.file_pattern}")
                 return self.get_extraction_result([])
 
-            for file_path in files:
-                self._current_file = str(file_path)
-                logger.info(f"Processing file: {file_path}")
-
-                if file_path.suffix.lower() == ".json":
-                    records = self._extract_json(file_path)
-                else:
-                    records = self._extract_csv(file_path)
-
-                all_records.extend(records)
+            all_records.extend(self._iter_records(files))
 
             result = self.get_extraction_result(all_records)
             result.started_at = started_at
@@ -92,11 +189,62 @@ class CSVExtractor(BaseExtractor):
             return result
 
     def extract_batch(self, offset: int = 0, limit: int = 100) -> List[SourceRecord]:
-        """Extract a batch of records (loads entire file, returns slice)."""
-        # For file-based extraction, we load the entire file
-        # This could be optimized for very large files
-        result = self.extract()
-        return result.records[offset:offset + limit]
+        """Extract a batch of records, reading files only up to the end of the batch."""
+        self.reset()
+        return list(itertools.islice(self._iter_records(), offset, offset + limit))
+
+    def stream(self, batch_size: Optional[int] = None) -> Iterator[List[SourceRecord]]:
+        """Stream records in batches from a single pass over the files."""
+        batch_size = batch_size or self.source.batch_size
+        self.reset()
+        records = self._iter_records()
+
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                break
+            yield batch
+
+    def _iter_records(self, files: Optional[List[Path]] = None) -> Iterator[SourceRecord]:
+        """Lazily yield records from each matching file in turn."""
+        if files is None:
+            files = self._get_files()
+
+        # Per-row records are built through one pre-bound constructor
+        self._make_record = self.record_factory()
+
+        prefetch = self._prefetch_file if _FADV_WILLNEED is not None and len(files) > 1 else None
+        if prefetch:
+            for file_path in files[:PREFETCH_FILES]:
+                prefetch(file_path)
+
+        for index, file_path in enumerate(files):
+            if prefetch and index + PREFETCH_FILES < len(files):
+                prefetch(files[index + PREFETCH_FILES])
+
+            self._current_file = str(file_path)
+            logger.info(f"Processing file: {file_path}")
+
+            if file_path.suffix.lower() == ".json":
+                yield from self._extract_json(file_path)
+            elif self.use_arrow:
+                yield from self._extract_csv_arrow(file_path)
+            else:
+                yield from self._extract_csv(file_path)
+
+    @staticmethod
+    def _prefetch_file(file_path: Path) -> None:
+        """Ask the kernel to start reading a file into the page cache in the background."""
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, _FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
     def _get_files(self) -> List[Path]:
         """Get list of files to process."""
@@ -113,116 +261,210 @@ class CSVExtractor(BaseExtractor):
 
         return sorted(set(files))
 
-    def _extract_csv(self, file_path: Path) -> List[SourceRecord]:
+    def _extract_csv(self, file_path: Path, skip_rows: int = 0) -> Iterator[SourceRecord]:
         """Extract records from a CSV file."""
-        records = []
+        delimiter = self.delimiter
+        rows_read = skip_rows
 
         try:
             with open(file_path, "r", encoding=self.encoding, newline="") as f:
-                # Try to detect delimiter if not specified
-                sample = f.read(8192)
-                f.seek(0)
-
-                try:
-                    dialect = csv.Sniffer().sniff(sample)
-                    delimiter = dialect.delimiter
-                except csv.Error:
-                    delimiter = self.delimiter
+                delimiter = self._resolve_delimiter(file_path, f)
 
                 reader = csv.DictReader(f, delimiter=delimiter)
+                process_row = self._process_row
 
                 for row_num, row in enumerate(reader, start=1):
+                    if row_num <= skip_rows:
+                        continue
+                    rows_read = row_num
                     try:
-                        record = self._process_row(row, row_num)
-                        if record:
-                            records.append(record)
+                        record = process_row(row, row_num)
                     except Exception as e:
                         self.add_error(
                             f"Error processing row {row_num}: {str(e)}",
                             record_id=str(row_num)
                         )
+                        continue
+                    if record:
+                        yield record
 
         except UnicodeDecodeError:
-            # Try with different encoding
+            # Try with different encoding, resuming after the rows already yielded
             logger.warning(f"UTF-8 decode failed, trying latin-1 for {file_path}")
-            return self._extract_csv_with_encoding(file_path, "latin-1")
+            yield from self._extract_csv_with_encoding(file_path, "latin-1", delimiter, skip_rows=rows_read)
         except Exception as e:
             self.add_error(f"Failed to read CSV file {file_path}: {str(e)}")
 
-        return records
+    def _resolve_delimiter(self, file_path: Path, f: Optional[TextIO] = None) -> str:
+        """Return the delimiter for a file, sniffing a sample when enabled."""
+        if not self.sniff_delimiter:
+            return self.delimiter
 
-    def _extract_csv_with_encoding(self, file_path: Path, encoding: str) -> List[SourceRecord]:
-        """Extract CSV with alternative encoding."""
-        records = []
+        if f is not None:
+            sample = f.read(8192)
+            f.seek(0)
+        else:
+            with open(file_path, "r", encoding=self.encoding, errors="replace", newline="") as sample_file:
+                sample = sample_file.read(8192)
+
+        # Reuse the delimiter found for a sibling file only if this file's header has it
+        key = (file_path.parent, file_path.suffix.lower())
+        delimiter = self._sniffed_delimiters.get(key)
+        if delimiter is not None and delimiter in sample.partition("\n")[0]:
+            return delimiter
+
+        try:
+            delimiter = _DelimiterSniffer().sniff(sample).delimiter
+        except csv.Error:
+            return self.delimiter
 
+        self._sniffed_delimiters[key] = delimiter
+        return delimiter
+
+    def _extract_csv_arrow(self, file_path: Path) -> Iterator[SourceRecord]:
+        """Extract records from a CSV file, tokenized by pyarrow's block-parallel reader.
+
+        Arrow only splits the file into raw string cells; each row then goes
+        through _process_row, so records match the csv module path exactly.
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            raise ImportError("pyarrow is required for use_arrow=True. Install with: pip install pyarrow")
+
+        rows_read = 0
+
+        try:
+            delimiter = self._resolve_delimiter(file_path)
+            with open(file_path, "r", encoding=self.encoding, newline="") as f:
+                header = next(csv.reader(f, delimiter=delimiter), None)
+            if not header:
+                return
+
+            reader = pa_csv.open_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(block_size=8 << 20, encoding=self.encoding),
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                # Keep every cell as its original text; typing is left to _infer_type
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            names = reader.schema.names
+            if not all(pa.types.is_string(field.type) for field in reader.schema):
+                raise pa.ArrowInvalid("header did not match the csv module's parse")
+
+            process_row = self._process_row
+            for batch in reader:
+                for values in zip(*(column.to_pylist() for column in batch.columns)):
+                    rows_read += 1
+                    try:
+                        record = process_row(dict(zip(names, values)), rows_read)
+                    except Exception as e:
+                        self.add_error(
+                            f"Error processing row {rows_read}: {str(e)}",
+                            record_id=str(rows_read)
+                        )
+                        continue
+                    if record:
+                        yield record
+
+        except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+            # Ragged rows, undecodable text and the like: finish the file with
+            # the csv module, which also handles the latin-1 fallback
+            logger.warning(f"Arrow CSV read failed for {file_path} ({e}), falling back to csv module")
+            yield from self._extract_csv(file_path, skip_rows=rows_read)
+        except Exception as e:
+            self.add_error(f"Failed to read CSV file {file_path}: {str(e)}")
+
+    def _extract_csv_with_encoding(
+        self,
+        file_path: Path,
+        encoding: str,
+        delimiter: Optional[str] = None,
+        skip_rows: int = 0
+    ) -> Iterator[SourceRecord]:
+        """Extract CSV with alternative encoding."""
         with open(file_path, "r", encoding=encoding, newline="") as f:
-            reader = csv.DictReader(f, delimiter=self.delimiter)
+            reader = csv.DictReader(f, delimiter=delimiter or self.delimiter)
+            process_row = self._process_row
 
             for row_num, row in enumerate(reader, start=1):
+                if row_num <= skip_rows:
+                    continue
                 try:
-                    record = self._process_row(row, row_num)
-                    if record:
-                        records.append(record)
+                    record = process_row(row, row_num)
                 except Exception as e:
                     self.add_error(
                         f"Error processing row {row_num}: {str(e)}",
                         record_id=str(row_num)
                     )
+                    continue
+                if record:
+                    yield record
 
-        return records
-
-    def _extract_json(self, file_path: Path) -> List[SourceRecord]:
+    def _extract_json(self, file_path: Path) -> Iterator[SourceRecord]:
         """Extract records from a JSON file."""
-        records = []
-
         try:
-            with open(file_path, "r", encoding=self.encoding) as f:
-                data = json.load(f)
-
-            # Handle different JSON structures
-            if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict):
-                # Look for common data fields
-                for key in ["data", "records", "items", "results"]:
-                    if key in data and isinstance(data[key], list):
-                        items = data[key]
-                        break
-                else:
-                    # Single record
-                    items = [data]
-            else:
-                self.add_error(f"Unexpected JSON structure in {file_path}")
-                return []
-
-            for idx, item in enumerate(items):
-                try:
-                    record = self._process_json_item(item, idx)
-                    if record:
-                        records.append(record)
-                except Exception as e:
-                    self.add_error(
-                        f"Error processing item {idx}: {str(e)}",
-                        record_id=str(idx)
-                    )
-
-        except json.JSONDecodeError as e:
+            with self._open_json(file_path) as f:
+                data = orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
             self.add_error(f"Invalid JSON in {file_path}: {str(e)}")
+            return
         except Exception as e:
             self.add_error(f"Failed to read JSON file {file_path}: {str(e)}")
+            return
+
+        # Handle different JSON structures
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            # Look for common data fields
+            for key in ["data", "records", "items", "results"]:
+                if key in data and isinstance(data[key], list):
+                    items = data[key]
+                    break
+            else:
+                # Single record
+                items = [data]
+        else:
+            self.add_error(f"Unexpected JSON structure in {file_path}")
+            return
+
+        process_item = self._process_json_item
+        for idx, item in enumerate(items):
+            try:
+                record = process_item(item, idx)
+            except Exception as e:
+                self.add_error(
+                    f"Error processing item {idx}: {str(e)}",
+                    record_id=str(idx)
+                )
+                continue
+            if record:
+                yield record
 
-        return records
+    def _open_json(self, file_path: Path):
+        """Open a JSON/JSONL file in the mode orjson reads fastest for this encoding."""
+        if self._read_mode == "rb":
+            return open(file_path, "rb")
+        return open(file_path, "r", encoding=self.encoding)
 
     def _process_row(self, row: Dict[str, str], row_num: int) -> Optional[SourceRecord]:
         """Process a CSV row into a SourceRecord."""
         # Apply column mapping
         data = {}
+        mapped_name = self.column_mapping.get
+        infer_type = self._infer_type
         for csv_col, value in row.items():
             if csv_col is None:
                 continue
 
             # Map column name if mapping exists
-            field_name = self.column_mapping.get(csv_col, csv_col)
+            field_name = mapped_name(csv_col, csv_col)
 
             # Clean up the value
             if value is not None:
@@ -231,7 +473,7 @@ class CSVExtractor(BaseExtractor):
                     value = None
                 else:
                     # Try to infer types
-                    value = self._infer_type(value)
+                    value = infer_type(value)
 
             data[field_name] = value
 
@@ -242,10 +484,11 @@ class CSVExtractor(BaseExtractor):
         if all(v is None for v in data.values()):
             return None
 
-        return self.create_record(
+        return self._make_record(
             id=str(record_id),
             data=data,
-            raw_data=dict(row),
+            # DictReader hands out a fresh dict per row, so no copy is needed
+            raw_data=row,
             metadata={"source_file": self._current_file, "row_number": row_num},
         )
 
@@ -263,34 +506,36 @@ class CSVExtractor(BaseExtractor):
         # Get record ID
         record_id = data.get(self.id_column) or data.get("id") or str(idx)
 
-        return self.create_record(
+        return self._make_record(
             id=str(record_id),
             data=data,
-            raw_data=item,
+            raw_data=item if data is not item else None,
             metadata={"source_file": self._current_file, "item_index": idx},
         )
 
     def _infer_type(self, value: str) -> Union[str, int, float, bool, None]:
         """Infer the type of a string value."""
-        if value is None or value == "":
+        # Stays per cell: "1"/"0" become True/False here, which column-wise
+        # numeric coercion (e.g. pandas.to_numeric) would turn into ints
+        if not value:
             return None
 
-        # Check for boolean
-        if value.lower() in ("true", "yes", "1"):
-            return True
-        if value.lower() in ("false", "no", "0"):
-            return False
+        # Check for boolean / null with a single lowercase and one dict probe
+        token = _LITERAL_TOKENS.get(value.lower(), _NO_TOKEN)
+        if token is not _NO_TOKEN:
+            return token
 
-        # Check for null
-        if value.lower() in ("null", "none", "n/a", "na", ""):
-            return None
+        # Plain text can't be numeric; skip the exception-driven parses
+        first = value[0]
+        if first not in _NUMERIC_START and not first.isdigit() and not first.isspace():
+            return value
 
         # Check for integer
-        try:
-            if "." not in value:
+        if "." not in value:
+            try:
                 return int(value)
-        except ValueError:
-            pass
+            except ValueError:
+                pass
 
         # Check for float
         try:
@@ -321,34 +566,33 @@ class CSVExtractor(BaseExtractor):
 class JSONLExtractor(CSVExtractor):
     """Extractor for JSON Lines (JSONL) files."""
 
-    def _extract_json(self, file_path: Path) -> List[SourceRecord]:
+    def _extract_json(self, file_path: Path) -> Iterator[SourceRecord]:
         """Extract records from a JSONL file."""
-        records = []
-
         try:
-            with open(file_path, "r", encoding=self.encoding) as f:
+            with self._open_json(file_path) as f:
+                process_item = self._process_json_item
                 for line_num, line in enumerate(f, start=1):
-                    line = line.strip()
-                    if not line:
+                    # orjson skips surrounding whitespace itself
+                    if line.isspace():
                         continue
 
                     try:
-                        item = json.loads(line)
-                        record = self._process_json_item(item, line_num)
-                        if record:
-                            records.append(record)
-                    except json.JSONDecodeError as e:
+                        item = orjson.loads(line)
+                        record = process_item(item, line_num)
+                    except orjson.JSONDecodeError as e:
                         self.add_error(
                             f"Invalid JSON on line {line_num}: {str(e)}",
                             record_id=str(line_num)
                         )
+                        continue
                     except Exception as e:
                         self.add_error(
                             f"Error processing line {line_num}: {str(e)}",
                             record_id=str(line_num)
                         )
+                        continue
+                    if record:
+                        yield record
 
         except Exception as e:
             self.add_error(f"Failed to read JSONL file {file_path}: {str(e)}")
-
-        return records
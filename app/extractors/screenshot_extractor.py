@@ -333,7 +333,6 @@ Return ONLY valid JSON in this format:
             record = self.create_record(
                 id=record_id,
                 data=item,
-                raw_data=item,
                 metadata={
                     "source_file": str(source_file),
                     "extraction_confidence": extracted.get("metadata", {}).get("confidence", "unknown"),
@@ -328,7 +328,6 @@ Additional configuration:
             record = self.create_record(
                 id=record_id,
                 data=item,
-                raw_data=item,
                 metadata={
                     "source_url": self.source.url,
                     "extraction_method": "browser_use",
@@ -351,7 +350,6 @@ Additional configuration:
             record = self.create_record(
                 id=record_id,
                 data=item,
-                raw_data=item,
                 metadata={
                     "source_url": self.source.url,
                     "extraction_method": "playwright",
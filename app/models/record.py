@@ -39,7 +39,7 @@ class ValidationError:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceRecord:
     """A record extracted from a source system."""
     id: str
@@ -49,7 +49,7 @@ class SourceRecord:
     extracted_at: datetime = field(default_factory=datetime.utcnow)
     source_type: str = "api"  # api, csv, screenshot, etc.
     source_file: Optional[str] = None
-    raw_data: Optional[Dict[str, Any]] = None  # Original unprocessed data
+    raw_data: Optional[Dict[str, Any]] = None  # Original data, when it differs from data
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
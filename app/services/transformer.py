@@ -19,6 +19,11 @@ from ..models.record import (
 
 logger = logging.getLogger(__name__)
 
+# Path segment with an array index, e.g. "items[0]"
+_ARRAY_INDEX_RE = re.compile(r"^(\w+)\[(\d+)\]$")
+# Characters stripped by clean_phone
+_NON_PHONE_RE = re.compile(r"[^\d+]")
+
 
 class TransformEngine:
     """
@@ -95,8 +100,74 @@ class TransformEngine:
         Returns:
             Transformed record
         """
+        return self._apply_mapping(
+            source_records,
+            mapping,
+            self._resolve_field_transforms(mapping),
+            target_service,
+            target_entity,
+            context or {},
+        )
+
+    def transform_records(
+        self,
+        records: List[SourceRecord],
+        mapping: EntityMapping,
+        target_service: str,
+        target_entity: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[TransformedRecord]:
+        """
+        Transform each source record independently with the same mapping.
+
+        Transform lookup for the mapping's fields is done once for the batch
+        rather than once per record. Each record gets its own shallow copy of
+        ``context``, so a transform that writes to it can't leak into the next.
+        """
+        resolved = self._resolve_field_transforms(mapping)
         context = context or {}
+        return [
+            self._apply_mapping([record], mapping, resolved, target_service, target_entity, dict(context))
+            for record in records
+        ]
 
+    def _resolve_field_transforms(
+        self,
+        mapping: EntityMapping
+    ) -> List[Tuple[FieldMapping, str, Optional[Callable]]]:
+        """Look up the transform function for each field mapping."""
+        resolved = []
+        for field_mapping in mapping.field_mappings:
+            transform_name = (
+                field_mapping.transform.value
+                if isinstance(field_mapping.transform, TransformType)
+                else field_mapping.transform
+            )
+
+            transform_func = (
+                self._custom_transforms.get(transform_name) or
+                self._builtin_transforms.get(transform_name)
+            )
+
+            if not transform_func:
+                if transform_name == TransformType.CUSTOM.value:
+                    # Custom transform requires a registered function
+                    func_name = field_mapping.transform_config.get("function")
+                    transform_func = self._custom_transforms.get(func_name)
+
+            resolved.append((field_mapping, transform_name, transform_func))
+        return resolved
+
+    def _apply_mapping(
+        self,
+        source_records: List[SourceRecord],
+        mapping: EntityMapping,
+        resolved: List[Tuple[FieldMapping, str, Optional[Callable]]],
+        target_service: str,
+        target_entity: str,
+        context: Dict[str, Any]
+    ) -> TransformedRecord:
+        """Apply resolved field transforms to source record(s)."""
         # Build combined source data for lookups
         combined_data = {}
         for record in source_records:
@@ -110,7 +181,7 @@ class TransformEngine:
         errors = []
         warnings = []
 
-        for field_mapping in mapping.field_mappings:
+        for field_mapping, transform_name, transform_func in resolved:
             try:
                 # Check condition if present
                 if field_mapping.condition:
@@ -125,23 +196,6 @@ class TransformEngine:
                 )
 
                 # Apply transformation
-                transform_name = (
-                    field_mapping.transform.value
-                    if isinstance(field_mapping.transform, TransformType)
-                    else field_mapping.transform
-                )
-
-                transform_func = (
-                    self._custom_transforms.get(transform_name) or
-                    self._builtin_transforms.get(transform_name)
-                )
-
-                if not transform_func:
-                    if transform_name == TransformType.CUSTOM.value:
-                        # Custom transform requires a registered function
-                        func_name = field_mapping.transform_config.get("function")
-                        transform_func = self._custom_transforms.get(func_name)
-
                 if transform_func:
                     transformed_value = transform_func(
                         source_value,
@@ -236,6 +290,10 @@ class TransformEngine:
 
     def _get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
         """Get a nested value using dot notation."""
+        # Most mappings name a top-level key; skip the path walk for those
+        if "." not in path and "[" not in path and isinstance(data, dict):
+            return data.get(path)
+
         parts = path.split(".")
         value = data
 
@@ -244,7 +302,7 @@ class TransformEngine:
                 return None
 
             # Handle array indexing (e.g., "items[0]" or "items.0")
-            array_match = re.match(r"^(\w+)\[(\d+)\]$", part)
+            array_match = _ARRAY_INDEX_RE.match(part)
             if array_match:
                 key, index = array_match.groups()
                 if isinstance(value, dict):
@@ -661,7 +719,7 @@ class TransformEngine:
             return None
 
         # Remove common formatting characters
-        phone = re.sub(r"[^\d+]", "", str(value))
+        phone = _NON_PHONE_RE.sub("", str(value))
 
         # Ensure it starts with + for international
         if phone and not phone.startswith("+") and len(phone) > 10:
@@ -0,0 +1,127 @@
+"""Pagination ordering tests for the API extractors, against a local HTTP server."""
+
+import asyncio
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import orjson
+import pytest
+
+from app.extractors.api_extractor import APIExtractor, SalesforceExtractor
+from app.models.migration import DataSource, DataSourceType
+
+TOTAL = 95
+PAGE = 10
+
+
+class _PagedHandler(BaseHTTPRequestHandler):
+    """Serves TOTAL records as Stripe (cursor), Salesforce (next URL) or Chargebee (offset) pages."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = dict(parse_qsl(url.query))
+        # Finish pages out of order so concurrent fetches complete shuffled
+        time.sleep(random.uniform(0, 0.01))
+
+        if url.path.startswith("/stripe"):
+            start = int(query["starting_after"][3:]) + 1 if "starting_after" in query else 0
+            end = min(start + int(query["limit"]), TOTAL)
+            body = {
+                "data": [{"id": f"cus{i}", "n": i} for i in range(start, end)],
+                "has_more": end < TOTAL,
+            }
+        elif url.path.startswith("/sf"):
+            start = int(url.path.rsplit("/", 1)[1]) if url.path.startswith("/sf/next/") else 0
+            end = min(start + PAGE, TOTAL)
+            body = {"records": [{"Id": f"sf{i}", "n": i} for i in range(start, end)]}
+            if end < TOTAL:
+                body["nextRecordsUrl"] = f"/next/{end}"
+        else:
+            start = int(query.get("offset", 0))
+            end = min(start + int(query["limit"]), TOTAL)
+            body = {
+                "list": [{"customer": {"id": f"cb{i}", "n": i}} for i in range(start, end)],
+                "total_count": TOTAL,
+            }
+
+        payload = orjson.dumps(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PagedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _source(service: str, entity: str) -> DataSource:
+    return DataSource(
+        type=DataSourceType.API,
+        name=service,
+        service=service,
+        entity=entity,
+        api_key="test",
+        batch_size=PAGE,
+    )
+
+
+def _extractors(server_url):
+    return {
+        "cursor": (
+            lambda: APIExtractor(_source("stripe", "customers"), base_url=f"{server_url}/stripe"),
+            [f"cus{i}" for i in range(TOTAL)],
+        ),
+        "linked": (
+            lambda: SalesforceExtractor(_source("salesforce", "Account"), instance_url=f"{server_url}/sf"),
+            [f"sf{i}" for i in range(TOTAL)],
+        ),
+        "offset": (
+            lambda: APIExtractor(_source("chargebee", "customers"), base_url=f"{server_url}/cb"),
+            [f"cb{i}" for i in range(TOTAL)],
+        ),
+    }
+
+
+@pytest.mark.parametrize("pagination", ["cursor", "linked", "offset"])
+def test_extract_returns_pages_in_order(server_url, pagination):
+    make, expected = _extractors(server_url)[pagination]
+
+    result = make().extract()
+
+    assert not result.errors
+    assert [r.id for r in result.records] == expected
+
+
+@pytest.mark.parametrize("pagination", ["cursor", "linked", "offset"])
+def test_extract_async_returns_pages_in_order(server_url, pagination):
+    make, expected = _extractors(server_url)[pagination]
+
+    result = asyncio.run(make().extract_async())
+
+    assert not result.errors
+    assert [r.id for r in result.records] == expected
+
+
+def test_offset_records_are_unwrapped(server_url):
+    make, _ = _extractors(server_url)["offset"]
+
+    record = make().extract().records[0]
+
+    assert record.data == {"id": "cb0", "n": 0}
+    assert record.raw_data == {"customer": {"id": "cb0", "n": 0}}
@@ -0,0 +1,83 @@
+"""Tests for the auth routes and session stores."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import auth
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(auth, "session_store", auth.InMemorySessionStore())
+    monkeypatch.setattr(auth, "_login_attempts", {})
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    return TestClient(app)
+
+
+def _login(client):
+    response = client.post(
+        "/auth/login",
+        json={"username": auth.ADMIN_USERNAME, "password": auth.ADMIN_PASSWORD},
+    )
+    assert response.status_code == 200
+    return response.cookies["session_token"]
+
+
+def test_status_returns_304_for_matching_etag(client):
+    _login(client)
+
+    first = client.get("/auth/status")
+    assert first.status_code == 200
+    assert first.json() == {"authenticated": True, "username": auth.ADMIN_USERNAME}
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    etag = first.headers["ETag"]
+
+    second = client.get("/auth/status", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    assert second.headers["Cache-Control"] == "private, no-cache"
+
+    stale = client.get("/auth/status", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+
+
+def test_status_after_logout_is_not_cached(client):
+    _login(client)
+    etag = client.get("/auth/status").headers["ETag"]
+
+    client.post("/auth/logout")
+    response = client.get("/auth/status", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"authenticated": False, "username": None}
+    assert "ETag" not in response.headers
+
+
+def test_expired_session_is_rejected():
+    store = auth.InMemorySessionStore()
+
+    async def run():
+        await store.create("old", timedelta(seconds=-1))
+        await store.create("new", timedelta(hours=1))
+        return await store.exists("old"), await store.exists("new")
+
+    assert asyncio.run(run()) == (False, True)
+
+
+def test_sweep_purges_only_expired_sessions():
+    store = auth.InMemorySessionStore()
+
+    async def run():
+        await store.create("old", timedelta(seconds=-1))
+        await store.create("new", timedelta(hours=1))
+
+    asyncio.run(run())
+
+    assert store.sweep() == 1
+    assert list(store._sessions) == ["new"]
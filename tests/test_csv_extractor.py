@@ -0,0 +1,59 @@
+"""Tests for the CSV extractor."""
+
+import pytest
+
+from app.extractors.csv_extractor import CSVExtractor
+from app.models.migration import DataSource, DataSourceType
+
+
+def test_sniffed_delimiter_not_reused_for_mixed_files(tmp_path):
+    (tmp_path / "a.csv").write_text("id,name,qty\n1,x,3\n2,y,4\n")
+    (tmp_path / "b.csv").write_text("id;name;qty\n3;z;5\n4;w;6\n")
+    source = DataSource(
+        name="mixed",
+        type=DataSourceType.CSV,
+        service="test",
+        entity="items",
+        file_pattern=str(tmp_path / "*.csv"),
+    )
+
+    result = CSVExtractor(source).extract()
+
+    assert not result.errors
+    assert [r.data for r in result.records] == [
+        {"id": 1, "name": "x", "qty": 3},
+        {"id": 2, "name": "y", "qty": 4},
+        {"id": 3, "name": "z", "qty": 5},
+        {"id": 4, "name": "w", "qty": 6},
+    ]
+
+
+def test_arrow_reader_matches_csv_module(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "id,flag,code,amount,note,created\n"
+        "0,1,01, 5 ,abc,2024-01-01\n"
+        "1,0,007,1.5,,2024-01-02T10:00:00Z\n"
+        "2,yes,x1,NULL,\"quoted, text\",\n"
+        "3,No,-4,inf,  padded  ,na\n"
+        ",,,,,\n"
+        "5,TRUE,1e3,nan,N/A,None\n"
+    )
+    source = DataSource(
+        name="data",
+        type=DataSourceType.CSV,
+        service="test",
+        entity="items",
+        file_path=str(path),
+    )
+
+    expected = CSVExtractor(source).extract()
+    actual = CSVExtractor(source, use_arrow=True).extract()
+
+    assert not actual.errors
+
+    def snapshot(result):
+        return [(r.id, r.data, r.raw_data, r.metadata) for r in result.records]
+
+    assert repr(snapshot(actual)) == repr(snapshot(expected))
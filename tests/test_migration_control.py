@@ -0,0 +1,115 @@
+"""Tests for the migration start/pause/resume/cancel routes."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.models import MigrationCreate, MigrationStatusEnum
+from app.api.routes import migrations
+from app.api.storage import migration_storage
+
+
+def _create():
+    return migration_storage.create(
+        MigrationCreate(name="control", target_service="chargebee", sources=[], entity_mappings=[])
+    )
+
+
+async def _call(route, migration_id):
+    return await route(migration_id, migration_storage.get(migration_id))
+
+
+async def _wait_for_status(migration_id, status, timeout=5.0):
+    async def poll():
+        while migration_storage.get(migration_id).status != status:
+            await asyncio.sleep(0)
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_start_runs_to_completion():
+    async def run():
+        migration = _create()
+        assert await _call(migrations.start_migration, migration.id) == {
+            "status": "started", "migration_id": migration.id,
+        }
+        await asyncio.wait_for(migrations._migration_tasks[migration.id], 5)
+        return migration.id
+
+    migration_id = asyncio.run(run())
+
+    assert migration_storage.get(migration_id).status == MigrationStatusEnum.COMPLETED
+    assert migration_id not in migrations._migration_tasks
+    assert migration_id not in migrations._pause_events
+    assert migration_id not in migrations._cancel_events
+
+
+def test_pause_holds_run_until_resumed():
+    async def run():
+        migration = _create()
+        await _call(migrations.start_migration, migration.id)
+        task = migrations._migration_tasks[migration.id]
+        await _wait_for_status(migration.id, MigrationStatusEnum.EXTRACTING)
+
+        assert await _call(migrations.pause_migration, migration.id) == {"status": "paused"}
+        for _ in range(200):
+            await asyncio.sleep(0)
+        assert not task.done()
+        assert migration_storage.get(migration.id).status == MigrationStatusEnum.PAUSED
+
+        assert await _call(migrations.resume_migration, migration.id) == {"status": "resumed"}
+        # Resuming wakes the existing run rather than spawning another
+        assert migrations._migration_tasks[migration.id] is task
+        await asyncio.wait_for(task, 5)
+        return migration.id
+
+    migration_id = asyncio.run(run())
+
+    assert migration_storage.get(migration_id).status == MigrationStatusEnum.COMPLETED
+
+
+def test_resume_without_live_run_starts_one():
+    async def run():
+        migration = _create()
+        migration_storage.update_status(migration.id, MigrationStatusEnum.PAUSED)
+        await _call(migrations.resume_migration, migration.id)
+        await asyncio.wait_for(migrations._migration_tasks[migration.id], 5)
+        return migration.id
+
+    migration_id = asyncio.run(run())
+
+    assert migration_storage.get(migration_id).status == MigrationStatusEnum.COMPLETED
+
+
+def test_cancel_stops_a_paused_run():
+    async def run():
+        migration = _create()
+        await _call(migrations.start_migration, migration.id)
+        task = migrations._migration_tasks[migration.id]
+        await _wait_for_status(migration.id, MigrationStatusEnum.EXTRACTING)
+        await _call(migrations.pause_migration, migration.id)
+
+        assert await _call(migrations.cancel_migration, migration.id) == {"status": "cancelled"}
+        await asyncio.wait_for(task, 5)
+        return migration.id
+
+    migration_id = asyncio.run(run())
+
+    assert migration_storage.get(migration_id).status == MigrationStatusEnum.CANCELLED
+    assert migration_id not in migrations._pause_events
+    assert migration_id not in migrations._cancel_events
+
+
+@pytest.mark.parametrize("route, status", [
+    (migrations.start_migration, MigrationStatusEnum.COMPLETED),
+    (migrations.pause_migration, MigrationStatusEnum.DRAFT),
+    (migrations.resume_migration, MigrationStatusEnum.EXTRACTING),
+])
+def test_control_rejects_wrong_status(route, status):
+    migration = _create()
+    migration_storage.update_status(migration.id, status)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(_call(route, migration.id))
+
+    assert exc_info.value.status_code == 400